@@ -2,32 +2,20 @@ import warnings
 warnings.filterwarnings("ignore")
 
 import streamlit as st
-from openai import OpenAI # <--- We switched libraries
-import time
+
+import prefetch
+import shared
+import theme
 
 # --- 1. CONFIGURATION ---
 st.set_page_config(page_title="RL GPS v26 Mobile", page_icon="🧭", layout="centered")
 
-st.markdown("""
-<style>
-    .stApp { background-color: #0e1117; color: white; }
-    .stButton button { width: 100%; border-radius: 12px; font-weight: bold; background-color: #d4af37; color: black; border: none; padding: 15px 0px; }
-    .stButton button:hover { background-color: #f4cf57; color: black; }
-    h1, h2 { color: #d4af37; text-align: center; font-family: 'Helvetica', sans-serif; text-transform: uppercase; letter-spacing: 2px; }
-    .step-text { text-align: center; font-size: 18px; margin-bottom: 20px; color: #ccc; }
-    .stDeployButton {display:none;}
-    .director-box { border: 1px solid #444; padding: 20px; border-radius: 15px; background-color: #1e1e1e; margin-top: 20px;}
-    
-    /* Gumroad Paywall Styles */
-    .paywall-box { border: 2px solid #ff90e8; padding: 30px; border-radius: 20px; text-align: center; background-color: #1a1a1a; margin-top: 50px; }
-    .price-tag { font-size: 40px; color: #d4af37; font-weight: bold; }
-    .per-month { font-size: 16px; color: #aaa; }
-</style>
-""", unsafe_allow_html=True)
+theme.apply("studio")
 
 # --- 2. BUSINESS CONFIGURATION ---
 GUMROAD_LINK = "https://rhythmlogic.gumroad.com/l/dldqoy" 
 ACCESS_CODE = "RHYTHM2026" 
+MODEL = "google/gemini-2.0-flash-001"  # Gemini via OpenRouter
 
 # --- 3. SESSION STATE ---
 if "authenticated" not in st.session_state: st.session_state.authenticated = False
@@ -35,6 +23,7 @@ if "step" not in st.session_state: st.session_state.step = 1
 if "project_type" not in st.session_state: st.session_state.project_type = "Book Chapter"
 if "work_style" not in st.session_state: st.session_state.work_style = "Teamwork"
 if "last_draft" not in st.session_state: st.session_state.last_draft = ""
+if "outline_spec" not in st.session_state: st.session_state.outline_spec = None
 
 # --- 4. THE PAYWALL ---
 if not st.session_state.authenticated:
@@ -78,12 +67,10 @@ if not api_key:
     api_key = st.text_input("Enter OpenRouter Key (sk-or-v1...):", type="password")
     if not api_key: st.stop()
 
-def run_openrouter(audio_file, mode, style, key, current_draft="", instruction=""):
-    # Connect to OpenRouter
-    client = OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=key,
-    )
+def run_openrouter(audio_file, mode, style, key, current_draft="", instruction="", outline="", outline_complete=True):
+    # Connect to OpenRouter (one shared client per key; the SDK is only
+    # imported the first time someone generates - the paywall never needs it)
+    client = shared.openrouter_client(key)
     
     # Transcription (Mockup for simplicity or use Whisper if available)
     # Since OpenRouter is text-first, we will treat audio as a prompt trigger for now
@@ -106,11 +93,18 @@ def run_openrouter(audio_file, mode, style, key, current_draft="", instruction="
         # If audio_file was passed, we would need to transcribe it first.
         # Since we are switching APIs, let's prompt the user for TEXT context if audio fails
         user_msg = f"Start the {mode}. {strategy_mandate}"
+        if outline:
+            # Head start: the structure was already drafted while the user typed.
+            # A cut-off outline is only the first few points, so say so.
+            if outline_complete:
+                user_msg = f"Start the {mode}. Follow this outline:\n{outline}\n\n{strategy_mandate}"
+            else:
+                user_msg = f"Start the {mode}. Here is a partial outline, extend it as needed:\n{outline}\n\n{strategy_mandate}"
 
     # CALL THE MODEL (Using Google Gemini Pro via OpenRouter)
     try:
         completion = client.chat.completions.create(
-            model="google/gemini-2.0-flash-001", # <--- Using Gemini via OpenRouter
+            model=MODEL,
             messages=[
                 {"role": "system", "content": system_msg},
                 {"role": "user", "content": user_msg},
@@ -120,10 +114,47 @@ def run_openrouter(audio_file, mode, style, key, current_draft="", instruction="
     except Exception as e:
         return f"Error: {e}"
 
+# --- HEAD START ---
+# Steps 1 and 2 already tell us the mode and style, so the outline for them
+# can be written in the background while the user types their idea
+def outline_messages(mode, style):
+    return [
+        {"role": "system", "content": f"You are a Creative Partner. Goal: Write a {mode}. Style: {style}."},
+        {"role": "user", "content": f"Give a short structural outline (5-7 bullet points) for a {mode}. Outline only, no intro."},
+    ]
+
+def cancel_outline():
+    if st.session_state.outline_spec:
+        st.session_state.outline_spec.cancel()
+        st.session_state.outline_spec = None
+
+def start_outline():
+    key = (st.session_state.project_type, st.session_state.work_style)
+    spec = st.session_state.outline_spec
+    if spec and spec.key == key:
+        return
+    cancel_outline()
+    client = shared.openrouter_client(api_key)
+    st.session_state.outline_spec = prefetch.speculate(key, client, MODEL, outline_messages(*key))
+
+def take_outline():
+    # -> (outline text for the first draft or "", complete). Never waits: an
+    # unfinished outline is used only if enough of it has streamed in already
+    spec = st.session_state.outline_spec
+    st.session_state.outline_spec = None
+    if not spec or spec.key != (st.session_state.project_type, st.session_state.work_style):
+        return "", True
+    text, complete = spec.take()
+    return text or "", complete
+
 # --- APP FLOW ---
 with st.sidebar:
     st.success("✅ **Connected**")
+    # Off by default: every outline is a paid call on the key, made before
+    # the user has asked for anything
+    head_start = st.toggle("⚡ Head start", value=False, help="Outlines your project in the background while you type, so the first draft arrives sooner. Uses a few extra tokens per project.")
     if st.button("Log Out"):
+        cancel_outline()
         st.session_state.authenticated = False
         st.rerun()
 
@@ -143,6 +174,8 @@ elif st.session_state.step == 2:
     if st.button("Enter Studio 🚀"):
         st.session_state.work_style = style
         st.session_state.step = 3
+        # Open the connection now: the first generation skips DNS + TLS setup
+        prefetch.prewarm(shared.openrouter_client(api_key))
         st.rerun()
 
 elif st.session_state.step == 3:
@@ -150,11 +183,16 @@ elif st.session_state.step == 3:
     
     # Input Area
     if not st.session_state.last_draft:
+        if head_start:
+            start_outline()
+        else:
+            cancel_outline()
         user_input = st.text_area("What is your idea? (Dictate or Type)", height=150)
         if st.button("⚡ Run Rhythm Logic"):
              with st.spinner("Connecting to OpenRouter..."):
                 # Pass the text as the 'instruction' since we removed direct audio processing for stability
-                result = run_openrouter(None, st.session_state.project_type, st.session_state.work_style, api_key, current_draft="", instruction=user_input)
+                outline, outline_complete = take_outline() if head_start else ("", True)
+                result = run_openrouter(None, st.session_state.project_type, st.session_state.work_style, api_key, current_draft="", instruction=user_input, outline=outline, outline_complete=outline_complete)
                 st.session_state.last_draft = result
                 st.rerun()
 
@@ -1,61 +1,42 @@
 import streamlit as st
-import requests
-import pandas as pd
-import time
+
+import link_discovery
+import profiling
+import shared
+import theme
 
 # --- PAGE CONFIG ---
 st.set_page_config(page_title="Empire Monitor", page_icon="🟢", layout="wide")
 
 # --- CUSTOM CSS ---
-st.markdown("""
-<style>
-    .stApp { background-color: #0e1117; color: white; }
-    h1 { color: #d4af37; font-family: 'Helvetica', sans-serif; text-transform: uppercase; }
-    .status-live { color: #00ff00; font-weight: bold; background-color: #003300; padding: 5px; border-radius: 5px;}
-    .status-broken { color: #ff4b4b; font-weight: bold; background-color: #330000; padding: 5px; border-radius: 5px;}
-    .stTextArea textarea { background-color: #1e1e1e; color: #fff; }
-</style>
-""", unsafe_allow_html=True)
+theme.apply("monitor")
 
 st.title("🟢 The Empire Monitor")
-st.markdown("Paste your `hub.py` links below to check for broken pages instantly.")
+st.markdown("Every link the apps use is found automatically. Add or remove lines below, then run the check.")
+
+# --- LINKS ---
+# Hand-added links that don't live in the catalog or any page source
+EXTRA_LINKS = [
+    "https://www.google.com",
+    "https://gpsv26-mobile-ze6vywftyjsfzpgf9ogrga.streamlit.app/",
+    "Bubblebum-Books.redbubble.com",
+    "https://form.jotform.com/260105280536045",
+    "https://rhythmlogic.gumroad.com/l/jrsdb",
+]
 
-# --- CHECK FUNCTION ---
-def check_status(url):
-    try:
-        # User-Agent makes us look like a real Chrome browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        r = requests.get(url, headers=headers, timeout=5)
-        if r.status_code == 200:
-            return "🟢 LIVE"
-        elif r.status_code == 404:
-            return "🔴 BROKEN (404)"
-        elif r.status_code == 403:
-            return "🟠 BLOCKED (403)" # Site works but blocks bots
-        else:
-            return f"⚠️ {r.status_code}"
-    except:
-        return "💀 UNREACHABLE"
+@st.cache_data(ttl=300, show_spinner=False)
+def discovered_links():
+    # catalog.json + every page source, normalised and deduplicated
+    return link_discovery.discover(EXTRA_LINKS)
 
 # --- MAIN INTERFACE ---
 col1, col2 = st.columns([2, 1])
 
 with col1:
     st.subheader("📋 Your Empire Links")
-    # I pre-filled this with your main apps based on your screenshots
-    default_links = """https://rhythm-logic-live.streamlit.app/
-https://rhythm-logic-live.streamlit.app/
-https://www.google.com
-https://rhythmlogic.gumroad.com/l/dldqoy
-https://gpsv26-mobile-ze6vywftyjsfzpgf9ogrga.streamlit.app/
-https://rhythmlogicpublishing.com/
-https://bubblebumbooks.com/
-Bubblebum-Books.redbubble.com
-https://form.jotform.com/260105280536045
-https://rhythmlogic.gumroad.com/l/jrsdb
-"""
+    found = discovered_links()
+    st.caption(f"{len(found)} unique links found in catalog.json and the app pages.")
+    default_links = "\n".join(found) + "\n"
     urls_input = st.text_area("Paste Links (One per line):", default_links, height=400)
 
 with col2:
@@ -69,44 +50,50 @@ with col2:
             st.warning("Please paste some links first!")
             st.stop()
             
-        results = []
+        urls, dupes, invalid = link_discovery.dedupe(urls)
+        if invalid:
+            st.warning(f"Skipped {invalid} line{'' if invalid == 1 else 's'} that aren't links.")
+        if not urls:
+            st.stop()
         progress_bar = st.progress(0)
         status_text = st.empty()
-        
-        for i, url in enumerate(urls):
-            # Fix missing https
-            if not url.startswith('http'):
-                url = 'https://' + url
-            
+
+        def on_progress(done, total, url):
             status_text.text(f"Pinging: {url}...")
-            stat = check_status(url)
-            
-            # Add to list
-            results.append({"Link": url, "Status": stat})
-            
-            # Update Progress
-            progress_bar.progress((i + 1) / len(urls))
-            time.sleep(0.1) 
+            progress_bar.progress(done / max(total, 1))
+
+        # Each unique endpoint is probed once; redirects are followed once a day
+        with profiling.section("health check"):
+            results = link_discovery.audit(urls, shared.http_session(), progress=on_progress)
+        for row in results:
+            row["Found In"] = ", ".join(found.get(row["Link"], ["pasted"]))
         
         status_text.text("✅ Audit Complete")
         
         # --- SHOW RESULTS ---
         st.divider()
-        df = pd.DataFrame(results)
-        
-        # Live Stats
-        live = len(df[df['Status'] == "🟢 LIVE"])
-        dead = len(df) - live
+        with profiling.section("results table"):
+            import pandas as pd  # only needed once there are results to tabulate
+            df = pd.DataFrame(results)
+            
+            # Live Stats
+            live = len(df[df['Status'] == "🟢 LIVE"])
+            dead = len(df) - live
         
-        m1, m2 = st.columns(2)
-        m1.metric("Systems Online", live)
-        m2.metric("Issues Found", dead, delta_color="inverse")
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Unique Endpoints", df["Resolves To"].nunique())
+        m2.metric("Systems Online", live)
+        m3.metric("Issues Found", dead, delta_color="inverse")
+        m4.metric("Duplicates Skipped", dupes)
         
         st.dataframe(
             df, 
             column_config={
                 "Link": st.column_config.LinkColumn("Product Link"),
-                "Status": st.column_config.TextColumn("Health")
+                "Resolves To": st.column_config.LinkColumn("Resolves To"),
+                "Status": st.column_config.TextColumn("Health"),
+                "Redirected": st.column_config.CheckboxColumn("Redirected"),
+                "Found In": st.column_config.TextColumn("Found In")
             },
             use_container_width=True
         )
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""Render benchmark for the library mockup compositor.
+
+Runs each stage of compositor.py on synthetic covers against a local fixture
+background (no network) and reports wall time and peak memory per stage.
+
+    python bench_mockup.py                          # run + save to bench_mockup.json
+    python bench_mockup.py --out before.json        # save somewhere else
+    python bench_mockup.py --out after.json --compare bench_mockup.json
+                                                    # flag regressions vs an earlier run
+
+Every (stage, size) pair runs in its own child process so the peak memory
+numbers don't bleed into each other. Peak memory is the process high-water
+mark (ru_maxrss), reset once the fixtures are built, minus what the process
+held just before the stage ran. That also covers Pillow's own image buffers
+that tracemalloc can't see. Resetting the mark needs Linux; elsewhere peak
+memory is reported as n/a.
+"""
+import argparse
+import ctypes
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from PIL import Image, ImageDraw, ImageFilter
+
+import compositor
+import profiling
+
+STAGES = ["create_3d_book", "add_reflection", "composite_scene", "encode_png"]
+SIZES = {
+    "small": (400, 600),     # phone screenshot / thumbnail upload
+    "medium": (1600, 2400),  # typical ebook cover
+    "large": (2560, 4096),   # full-res KDP cover
+}
+BG_SIZE = (1920, 1080)
+
+# --- FIXTURES ---
+def make_cover(size):
+    # Deterministic "cover": gradient + title block + a little texture so
+    # LANCZOS and blur do real work (flat colours are unrealistically cheap)
+    w, h = size
+    cover = Image.linear_gradient("L").resize((w, h)).convert("RGB")
+    draw = ImageDraw.Draw(cover)
+    draw.rectangle([(w // 10, h // 3), (w - w // 10, h // 2)], fill=(212, 175, 55))
+    for i in range(0, w, max(w // 40, 1)):
+        draw.line([(i, 0), (w - i, h)], fill=(i % 255, 40, 90), width=2)
+    return cover
+
+def make_background(path=None):
+    if path:
+        return compositor.prepare_background(Image.open(path))
+    # Stand-in for BG_URL: warm gradient with "shelves", same size as the fallback
+    bg = Image.radial_gradient("L").resize(BG_SIZE).convert("RGB")
+    draw = ImageDraw.Draw(bg)
+    for y in range(0, BG_SIZE[1], 90):
+        draw.rectangle([(0, y), (BG_SIZE[0], y + 12)], fill=(60, 35, 20))
+    return compositor.prepare_background(bg.filter(ImageFilter.GaussianBlur(2)))
+
+def stage_inputs(stage, size, bg):
+    # Returns a zero-arg callable that runs one iteration of the stage
+    cover = make_cover(size)
+    if stage == "create_3d_book":
+        return lambda: compositor.create_3d_book(cover)
+    if stage == "add_reflection":
+        # Same scaling composite_scene applies before the reflection pass
+        book = compositor.create_3d_book(cover)
+        target_h = int(bg.height * 0.45)
+        scale = target_h / book.height
+        book = book.resize((int(book.width * scale), target_h), Image.Resampling.LANCZOS)
+        return lambda: compositor.add_reflection(book)
+    if stage == "composite_scene":
+        return lambda: compositor.composite_scene(cover, background=bg)
+    if stage == "encode_png":
+        scene = compositor.composite_scene(cover, background=bg)
+        return lambda: scene.save(io.BytesIO(), format="PNG")
+    raise ValueError(f"Unknown stage: {stage}")
+
+def release_free_memory():
+    # Freed fixture buffers stay resident in Pillow's block cache and glibc's
+    # arenas; the stage would reuse them without raising RSS at all
+    gc.collect()
+    Image.core.clear_cache()
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass  # not glibc
+
+# --- CHILD: ONE STAGE, ONE SIZE ---
+def run_child(stage, size_name, repeat, bg_path):
+    bg = make_background(bg_path)
+    fn = stage_inputs(stage, SIZES[size_name], bg)
+    # Building the fixtures already pushed the high-water mark up (the later
+    # stages run the earlier ones to get their inputs). Reset it so the peak
+    # below is the stage's own; where that's impossible, report n/a rather
+    # than a number that depends on the fixtures.
+    release_free_memory()
+    measurable = profiling.reset_peak()
+    rss_before = profiling.rss_mb()
+    fn()  # warm-up (lazy codec/filter init), still counted towards peak memory
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    peak = round(max(profiling.peak_rss_mb() - rss_before, 0.0), 2) if measurable else None
+    print(json.dumps({
+        "stage": stage,
+        "size": size_name,
+        "min_ms": round(min(times) * 1000, 2),
+        "median_ms": round(statistics.median(times) * 1000, 2),
+        "peak_mb": peak,
+    }))
+
+# --- PARENT: ORCHESTRATE + REPORT ---
+def run_suite(stages, sizes, repeat, bg_path):
+    results = []
+    for size_name in sizes:
+        for stage in stages:
+            cmd = [sys.executable, __file__, "--child", stage, size_name, "--repeat", str(repeat)]
+            if bg_path:
+                cmd += ["--background", bg_path]
+            out = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            row = json.loads(out.stdout.strip().splitlines()[-1])
+            results.append(row)
+            print(f"{stage:<16} {size_name:<7} median {row['median_ms']:>9.2f} ms   "
+                  f"min {row['min_ms']:>9.2f} ms   peak {fmt_mb(row['peak_mb'])}")
+    return results
+
+def fmt_mb(mb):
+    return "n/a" if mb is None else f"{mb:.1f} MB"
+
+def load_baseline(path):
+    with open(path) as f:
+        return {(r["stage"], r["size"]): r for r in json.load(f)["results"]}
+
+def compare(results, baseline, baseline_path, threshold):
+    regressions = []
+    print(f"\n--- vs {baseline_path} (threshold {threshold:.0%}) ---")
+    for row in results:
+        old = baseline.get((row["stage"], row["size"]))
+        if not old:
+            continue
+        change = row["median_ms"] / old["median_ms"] - 1 if old["median_ms"] else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  <-- SLOWER"
+            regressions.append(row)
+        elif change < -threshold:
+            flag = "  faster"
+        mem = ""
+        if row["peak_mb"] is not None and old.get("peak_mb") is not None:
+            mem = f"   peak {fmt_mb(old['peak_mb'])} -> {fmt_mb(row['peak_mb'])}"
+            # Ignore sub-MB noise from allocator rounding
+            if row["peak_mb"] - old["peak_mb"] > max(1.0, old["peak_mb"] * threshold):
+                flag += "  <-- MORE MEMORY"
+                if row not in regressions:
+                    regressions.append(row)
+        print(f"{row['stage']:<16} {row['size']:<7} {old['median_ms']:>9.2f} -> "
+              f"{row['median_ms']:>9.2f} ms ({change:+.0%}){mem}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the mockup compositor stages.")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--background", help="Local background image (default: generated fixture)")
+    parser.add_argument("--out", default="bench_mockup.json", help="Where to save this run")
+    parser.add_argument("--compare", help="Earlier results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Allowed slowdown before a stage counts as regressed (0.15 = 15%%)")
+    parser.add_argument("--child", nargs=2, metavar=("STAGE", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], args.child[1], args.repeat, args.background)
+        return
+
+    # Read the baseline before anything is written, and never overwrite it
+    # with the run it's being compared against
+    baseline = None
+    if args.compare:
+        if os.path.abspath(args.compare) == os.path.abspath(args.out):
+            parser.error(f"--out and --compare both point to {args.out}; save this run elsewhere, "
+                         "e.g. --out after.json")
+        baseline = load_baseline(args.compare)
+
+    results = run_suite(args.stages, args.sizes, args.repeat, args.background)
+    with open(args.out, "w") as f:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pillow": Image.__version__,
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+            "results": results,
+        }, f, indent=2)
+    print(f"\nSaved {len(results)} results to {args.out}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.compare, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) found.")
+            sys.exit(1)
+        print("\nNo regressions.")
+
+if __name__ == "__main__":
+    main()
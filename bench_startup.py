@@ -0,0 +1,155 @@
+"""Cold-start / import-time benchmark for the six Streamlit apps.
+
+Streamlit re-executes a script top to bottom on every run, and the first run
+in a fresh container pays for every module-level import. This measures, per
+app, what a visitor pays before the first widget shows up:
+
+    eager     imports at module level (paid on every cold start)
+    deferred  imports inside functions / branches (paid on first use only)
+
+    python bench_startup.py                     # current tree
+    python bench_startup.py --before HEAD~1     # ...and the saving vs an older commit
+
+Each measurement runs in a fresh interpreter with Streamlit already imported
+(the server has it loaded before any script runs), takes the best of
+--repeat runs, and counts local helper modules with everything they import.
+"""
+import argparse
+import ast
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+APPS = ["app.py", "auditor.py", "funnel.py", "hub.py", "mockup.py", "school.py"]
+ALWAYS_LOADED = {"streamlit", "__future__"}
+BRANCHES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.If, ast.For, ast.While)
+
+PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+import streamlit
+mods = {mods!r}
+t0 = time.perf_counter()
+for m in mods:
+    try:
+        __import__(m)
+    except Exception:
+        pass  # missing optional dependency: counts as free, same as at runtime
+print(time.perf_counter() - t0)
+"""
+
+# --- IMPORT DISCOVERY ---
+def classify_imports(source):
+    # Walk the script and sort every import into eager vs deferred
+    eager, deferred = [], []
+
+    def visit(node, nested):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.Import, ast.ImportFrom)):
+                if isinstance(child, ast.Import):
+                    names = [a.name for a in child.names]
+                else:
+                    names = [child.module] if child.module and not child.level else []
+                for name in names:
+                    if name.split(".")[0] in ALWAYS_LOADED:
+                        continue
+                    target = deferred if nested else eager
+                    if name not in target:
+                        target.append(name)
+            visit(child, nested or isinstance(child, BRANCHES))
+
+    visit(ast.parse(source), False)
+    deferred = [m for m in deferred if m not in eager]
+    return eager, deferred
+
+# --- TIMING ---
+def time_imports(root, mods, repeat):
+    if not mods:
+        return 0.0
+    code = PROBE.format(root=root, mods=mods)
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+        t = float(out.stdout.strip().splitlines()[-1])
+        best = t if best is None else min(best, t)
+    return best
+
+def measure_tree(root, repeat):
+    results = {}
+    for app in APPS:
+        path = os.path.join(root, app)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            eager, deferred = classify_imports(f.read())
+        eager_s = time_imports(root, eager, repeat)
+        # Deferred cost on top of the eager set (shared modules aren't double counted)
+        total_s = time_imports(root, eager + deferred, repeat)
+        results[app] = {
+            "eager": eager,
+            "deferred": deferred,
+            "eager_ms": round(eager_s * 1000, 1),
+            "deferred_ms": round(max(total_s - eager_s, 0.0) * 1000, 1),
+        }
+    return results
+
+def checkout(rev):
+    # Plain snapshot of an older commit (no worktree bookkeeping needed)
+    tmp = tempfile.mkdtemp(prefix="bench_startup_")
+    archive = subprocess.run(["git", "archive", "--format=tar", rev], capture_output=True, check=True).stdout
+    tar_path = os.path.join(tmp, "tree.tar")
+    with open(tar_path, "wb") as f:
+        f.write(archive)
+    with tarfile.open(tar_path) as tar:
+        tar.extractall(tmp)
+    os.remove(tar_path)
+    return tmp
+
+# --- REPORT ---
+def print_report(after, before=None):
+    if before:
+        print(f"{'app':<12} {'before':>10} {'after':>10} {'saved':>10}   {'deferred (first use)':>22}")
+    else:
+        print(f"{'app':<12} {'cold start':>10}   {'deferred (first use)':>22}")
+    for app, row in after.items():
+        deferred = f"{row['deferred_ms']:>8.1f} ms"
+        if before and app in before:
+            old = before[app]["eager_ms"]
+            saved = old - row["eager_ms"]
+            pct = f"({saved / old:.0%})" if old else ""
+            print(f"{app:<12} {old:>7.1f} ms {row['eager_ms']:>7.1f} ms {saved:>7.1f} ms {pct:>6} {deferred:>16}")
+        else:
+            print(f"{app:<12} {row['eager_ms']:>7.1f} ms   {deferred:>22}")
+    print()
+    for app, row in after.items():
+        print(f"{app:<12} eager: {', '.join(row['eager']) or '-'}")
+        print(f"{'':<12} deferred: {', '.join(row['deferred']) or '-'}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure module-level import cost per app.")
+    parser.add_argument("--before", help="git revision to compare against (e.g. HEAD~1)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; best is kept")
+    parser.add_argument("--json", help="also save the numbers to this file")
+    args = parser.parse_args()
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    after = measure_tree(here, args.repeat)
+    before = None
+    if args.before:
+        old_root = checkout(args.before)
+        try:
+            before = measure_tree(old_root, args.repeat)
+        finally:
+            shutil.rmtree(old_root, ignore_errors=True)
+
+    print_report(after, before)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"after": after, "before": before, "before_rev": args.before}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Prerender the funnel landing page to a static HTML bundle.
+
+The sales page never changes per visitor, so there's no reason to boot a
+Streamlit session for each one. This renders the same copy as funnel.py
+(from funnel_content.py) into plain HTML that any static host / CDN can serve:
+
+    python build_funnel.py                 # -> dist/funnel/
+    python build_funnel.py --out public/
+
+Output:
+    index.html      minified page, CSS inlined, images + video lazy-loaded
+    index.html.gz   precompressed copy for hosts that serve .gz directly
+    assets/         WebP + JPEG images, content-hashed names
+    _headers        Cache-Control rules (Netlify / Cloudflare Pages format)
+"""
+import argparse
+import gzip
+import os
+import re
+import shutil
+
+from PIL import Image
+
+import image_cache
+import theme
+from funnel_content import (
+    PAGE_TITLE, VIDEO_URL, CTA_PRIMARY, CTA_NOTE,
+    PROBLEM_IMAGE, PROBLEM_IMAGE_WIDTH, PROBLEM_IMAGE_CAPTION, PROBLEM_TITLE, PROBLEM_PARAGRAPHS,
+    SOLUTION_TITLE, SOLUTION_TAGLINE, FEATURES, FAQ_TITLE, FAQ,
+    hero_html, cta_html, feature_card_html, stack_html, footer_html,
+    bold_to_html, youtube_id, esc,
+)
+
+DEFAULT_OUT = os.path.join("dist", "funnel")
+POSTER_WIDTH = 960
+
+# HTML is short-lived so copy edits go out quickly; assets are content-hashed
+# so they can be cached forever
+HEADERS = """/
+  Cache-Control: public, max-age=300, stale-while-revalidate=86400
+/index.html
+  Cache-Control: public, max-age=300, stale-while-revalidate=86400
+/assets/*
+  Cache-Control: public, max-age=31536000, immutable
+/*
+  X-Content-Type-Options: nosniff
+  Referrer-Policy: strict-origin-when-cross-origin
+"""
+
+# What Streamlit gave us for free: page width, columns, expanders
+STATIC_CSS = """
+    * { box-sizing: border-box; }
+    body { margin: 0; background-color: #000000; color: white; font-family: 'Helvetica Neue', sans-serif; line-height: 1.6; }
+    a { color: #d4af37; }
+    img { max-width: 100%; height: auto; display: block; }
+    .wrap { max-width: 1200px; margin: 0 auto; padding: 0 20px 40px; }
+    .cols { display: grid; gap: 24px; }
+    @media (min-width: 768px) {
+        .cols-2 { grid-template-columns: 1fr 1fr; }
+        .cols-3 { grid-template-columns: 1fr 1fr 1fr; }
+        .video-col { max-width: 66%; margin: 0 auto; }
+    }
+    @media (max-width: 767px) {
+        .main-headline { font-size: 40px; }
+        .sub-headline { font-size: 18px; }
+        .stack-container { padding: 20px; }
+    }
+    figcaption { color: #888; font-size: 14px; text-align: center; margin-top: 6px; }
+    .yt { position: relative; display: block; aspect-ratio: 16 / 9; background: #111; border-radius: 12px; overflow: hidden; }
+    .yt img, .yt iframe { width: 100%; height: 100%; object-fit: cover; border: 0; }
+    .yt .play { position: absolute; inset: 0; margin: auto; width: 84px; height: 60px; border-radius: 14px; background: rgba(212, 175, 55, 0.9); }
+    .yt .play::after { content: ''; position: absolute; left: 34px; top: 18px; border-style: solid; border-width: 12px 0 12px 20px; border-color: transparent transparent transparent #000; }
+    details { border: 1px solid #333; border-radius: 8px; padding: 12px 16px; margin-bottom: 10px; }
+    summary { cursor: pointer; font-weight: bold; }
+"""
+
+# Swap the facade for the real player on click (nothing from YouTube loads before that)
+VIDEO_SCRIPT = """
+document.querySelectorAll('.yt').forEach(function (a) {
+  a.addEventListener('click', function (ev) {
+    ev.preventDefault();
+    var f = document.createElement('iframe');
+    f.src = 'https://www.youtube-nocookie.com/embed/' + a.dataset.id + '?autoplay=1';
+    f.allow = 'autoplay; encrypted-media; picture-in-picture';
+    f.allowFullscreen = true;
+    f.title = a.getAttribute('aria-label');
+    a.replaceWith(f);
+  });
+});
+"""
+
+# --- MINIFY ---
+def minify_js(js):
+    # Only strips indentation/newlines; the snippet has no comments or ASI traps
+    return re.sub(r"\s*\n\s*", "", js).strip()
+
+def minify_html(markup):
+    markup = re.sub(r"<!--.*?-->", "", markup, flags=re.S)
+    markup = re.sub(r">\s*\n\s*<", "><", markup)   # layout whitespace between tags
+    return re.sub(r"\s+", " ", markup).strip()
+
+# --- ASSETS ---
+def add_asset(src, out_dir):
+    os.makedirs(os.path.join(out_dir, "assets"), exist_ok=True)
+    name = os.path.basename(src)  # image_cache names are already content-hashed
+    shutil.copyfile(src, os.path.join(out_dir, "assets", name))
+    return f"assets/{name}"
+
+def picture_html(url, width, alt, out_dir, eager=False):
+    # <picture> with WebP + JPEG fallback from the local image cache. If the
+    # image can't be fetched at build time, fall back to the remote URL.
+    loading = "eager" if eager else "lazy"
+    paths = image_cache.thumbnail_set(url, width)
+    if not paths:
+        return f'<img src="{esc(url)}" alt="{esc(alt)}" loading="{loading}" decoding="async">'
+    with Image.open(paths["jpeg"]) as img:
+        w, h = img.size
+    jpeg = add_asset(paths["jpeg"], out_dir)
+    source = ""
+    if "webp" in paths:
+        source = f'<source type="image/webp" srcset="{add_asset(paths["webp"], out_dir)}">'
+    return (f'<picture>{source}<img src="{jpeg}" width="{w}" height="{h}" alt="{esc(alt)}" '
+            f'loading="{loading}" decoding="async"></picture>')
+
+def video_html(url, out_dir):
+    vid = youtube_id(url)
+    if not vid:
+        # Self-hosted file (e.g. demo.mp4): the browser only fetches metadata until play
+        return f'<video src="{esc(url)}" controls preload="none" style="width:100%"></video>'
+    poster = picture_html(f"https://i.ytimg.com/vi/{vid}/hqdefault.jpg", POSTER_WIDTH, "Watch the demo", out_dir)
+    return (f'<a class="yt" href="{esc(url)}" data-id="{vid}" aria-label="Play the demo video">'
+            f'{poster}<span class="play"></span></a>')
+
+# --- PAGE ---
+def render_page(out_dir):
+    problem = "".join(f"<p>{bold_to_html(p)}</p>" for p in PROBLEM_PARAGRAPHS)
+    features = "".join(feature_card_html(f) for f in FEATURES)
+    faq = "".join(f"<details><summary>{esc(q)}</summary><p>{esc(a)}</p></details>" for q, a in FAQ)
+    # Theme first: STATIC_CSS carries the mobile media queries, which must come
+    # after the unconditional theme rules they override
+    css = theme.css("funnel").replace(".stApp", "body") + theme.minify_css(STATIC_CSS)
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{esc(PAGE_TITLE)}</title>
+<meta name="description" content="{esc(SOLUTION_TAGLINE)}">
+<link rel="preconnect" href="https://rhythmlogic.gumroad.com">
+<style>{css}</style>
+</head>
+<body>
+<main class="wrap">
+{hero_html()}
+<div class="video-col"><div class="video-box">{video_html(VIDEO_URL, out_dir)}</div></div>
+{cta_html(CTA_PRIMARY, CTA_NOTE)}
+<section class="cols cols-2">
+<figure style="margin:0">{picture_html(PROBLEM_IMAGE, PROBLEM_IMAGE_WIDTH, PROBLEM_IMAGE_CAPTION, out_dir)}<figcaption>{esc(PROBLEM_IMAGE_CAPTION)}</figcaption></figure>
+<div><h3>{esc(PROBLEM_TITLE)}</h3>{problem}</div>
+</section>
+<br><br>
+<h2 style="text-align: center; color: white;">{esc(SOLUTION_TITLE)}</h2>
+<p style="text-align: center; color: #ccc;">{esc(SOLUTION_TAGLINE)}</p>
+<section class="cols cols-3">{features}</section>
+{stack_html()}
+<h3>{esc(FAQ_TITLE)}</h3>
+{faq}
+{footer_html()}
+</main>
+<script>{minify_js(VIDEO_SCRIPT)}</script>
+</body>
+</html>
+"""
+
+def build(out_dir):
+    if os.path.isdir(os.path.join(out_dir, "assets")):
+        shutil.rmtree(os.path.join(out_dir, "assets"))  # drop images from old builds
+    os.makedirs(out_dir, exist_ok=True)
+
+    page = minify_html(render_page(out_dir)).encode("utf-8")
+    with open(os.path.join(out_dir, "index.html"), "wb") as f:
+        f.write(page)
+    with open(os.path.join(out_dir, "index.html.gz"), "wb") as f:
+        # mtime=0 keeps the .gz byte-identical between builds of the same page
+        with gzip.GzipFile(fileobj=f, mode="wb", compresslevel=9, mtime=0) as gz:
+            gz.write(page)
+    with open(os.path.join(out_dir, "_headers"), "w") as f:
+        f.write(HEADERS)
+    return report(out_dir)
+
+def report(out_dir):
+    sizes = {}
+    for root, _, files in os.walk(out_dir):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            sizes[os.path.relpath(path, out_dir)] = os.path.getsize(path)
+    for name, size in sizes.items():
+        print(f"  {name:<60} {size / 1024:>8.1f} KB")
+    page = sizes.get("index.html.gz", sizes.get("index.html", 0))
+    assets = sum(s for n, s in sizes.items() if n.startswith("assets"))
+    print(f"First paint over the wire: {page / 1024:.1f} KB (gzipped HTML + inline CSS); "
+          f"lazy images: {assets / 1024:.1f} KB")
+    return sizes
+
+def main():
+    parser = argparse.ArgumentParser(description="Prerender funnel.py to a static HTML bundle.")
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"Output directory (default: {DEFAULT_OUT})")
+    args = parser.parse_args()
+    print(f"Building static funnel -> {args.out}")
+    build(args.out)
+
+if __name__ == "__main__":
+    main()
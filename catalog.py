@@ -0,0 +1,95 @@
+import json
+import logging
+import os
+import threading
+
+from catalog_search import SearchIndex, build_documents, catalog_version
+
+# --- THE CATALOG ---
+# Software, books and merch live in catalog.json so editing the store is a
+# data change, not a code deploy. The parsed catalog (and anything derived
+# from it, like the search index) is cached per process and reloaded only
+# when the file's modification time or size changes.
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog.json")
+
+REQUIRED_FIELDS = {
+    "software": ("name", "desc", "tag", "url"),
+    "books": ("title", "series", "img", "url"),
+    "merch": ("name", "url"),
+}
+
+log = logging.getLogger(__name__)
+
+class Catalog:
+    def __init__(self, data, source=None):
+        self.software = data.get("software", [])
+        self.books = data.get("books", [])
+        self.merch = data.get("merch", [])
+        self.source = source
+        self.version = catalog_version(self.software, self.books, self.merch)
+        self._derived = {}
+        self._lock = threading.Lock()
+
+    @property
+    def merch_links(self):
+        # The old hub.py MERCH_LINKS shape: {"Mila Moo": url, ...}
+        return {m["name"]: m["url"] for m in self.merch}
+
+    def derived(self, name, build):
+        # Memoise anything computed from the catalog. It lives on this object,
+        # so a reloaded catalog starts with a clean slate automatically.
+        with self._lock:
+            if name not in self._derived:
+                self._derived[name] = build(self)
+            return self._derived[name]
+
+    @property
+    def search_index(self):
+        return self.derived("search_index", lambda c: SearchIndex(build_documents(c.software, c.books, c.merch)))
+
+def validate(data):
+    if not isinstance(data, dict):
+        raise ValueError("Catalog must be a JSON object with software/books/merch lists")
+    for section, fields in REQUIRED_FIELDS.items():
+        items = data.get(section, [])
+        if not isinstance(items, list):
+            raise ValueError(f"Catalog '{section}' must be a list")
+        for i, item in enumerate(items):
+            if not isinstance(item, dict):
+                raise ValueError(f"Catalog '{section}' entry {i} must be an object")
+            missing = [f for f in fields if not item.get(f)]
+            if missing:
+                raise ValueError(f"Catalog '{section}' entry {i} is missing {', '.join(missing)}")
+    return data
+
+def parse_catalog(path):
+    with open(path, encoding="utf-8") as f:
+        return Catalog(validate(json.load(f)), source=path)
+
+# --- MTIME CACHE ---
+_cache = {}   # path -> (signature, Catalog)
+_cache_lock = threading.Lock()
+
+def _signature(path):
+    info = os.stat(path)
+    return (info.st_mtime_ns, info.st_size)
+
+def load_catalog(path=CATALOG_PATH):
+    # One stat() per call; the file is only re-read after it changes
+    with _cache_lock:
+        cached = _cache.get(path)
+        try:
+            sig = _signature(path)
+            if cached and cached[0] == sig:
+                return cached[1]
+            catalog = parse_catalog(path)
+        except (OSError, ValueError) as e:  # ValueError includes JSONDecodeError
+            if cached:
+                # Half-saved, broken or briefly missing (editor save-by-rename):
+                # keep serving the last good catalog
+                log.warning("Catalog %s is unreadable or invalid (%s); keeping the previous version", path, e)
+                return cached[1]
+            raise
+        _cache[path] = (sig, catalog)
+        return catalog
@@ -0,0 +1,141 @@
+import bisect
+import hashlib
+import json
+import re
+import unicodedata
+from collections import defaultdict
+
+# --- CATALOG SEARCH ---
+# Inverted index over the hub catalog (software, books, merch in one place).
+# Built once per catalog version; a query is a handful of dict lookups instead
+# of a substring scan over every name and description.
+#   exact token        -> full weight
+#   prefix ("enter")   -> as-you-type matches on the sorted vocabulary
+#   one typo ("enterprize", "qunatum") -> deletion-neighbourhood lookup
+
+# How much a hit in each field counts towards the score
+FIELD_WEIGHTS = {"title": 3.0, "tag": 2.0, "series": 2.0, "desc": 1.0}
+PREFIX_FACTOR = 0.6
+FUZZY_FACTOR = 0.4
+MIN_PREFIX_LEN = 2   # "e" would match half the vocabulary
+MIN_FUZZY_LEN = 4    # short words have too many one-edit neighbours
+
+STOPWORDS = {"a", "an", "and", "for", "in", "of", "on", "or", "the", "to", "with"}
+
+def tokenize(text):
+    # Lowercase, strip accents, split on anything that isn't a letter/digit
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode("ascii")
+    return [t for t in re.split(r"[^a-z0-9]+", text.lower()) if t and t not in STOPWORDS]
+
+def catalog_version(*parts):
+    # Stable fingerprint of the catalog data; changes whenever any entry does
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+def build_documents(software, books, merch):
+    # Flatten the three catalog shapes into one searchable list.
+    # "item" keeps the original entry so the UI can render it as usual.
+    docs = []
+    for app in software:
+        docs.append({"kind": "software", "title": app["name"], "url": app["url"],
+                     "fields": {"title": app["name"], "tag": app.get("tag", ""), "desc": app.get("desc", "")},
+                     "item": app})
+    for book in books:
+        docs.append({"kind": "book", "title": book["title"], "url": book["url"],
+                     "fields": {"title": book["title"], "series": book.get("series", ""), "desc": "book"},
+                     "item": book})
+    for item in merch:
+        docs.append({"kind": "merch", "title": item["name"], "url": item["url"],
+                     "fields": {"title": item["name"], "series": item.get("label", ""),
+                                "desc": item.get("desc", "") + " merch merchandise shop gear"},
+                     "item": item})
+    return docs
+
+def _deletes(term):
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+class SearchIndex:
+    def __init__(self, docs):
+        self.docs = docs
+        # token -> {doc_id: weight}
+        self.postings = defaultdict(dict)
+        for doc_id, doc in enumerate(docs):
+            for field, text in doc["fields"].items():
+                weight = FIELD_WEIGHTS.get(field, 1.0)
+                for token in tokenize(text):
+                    if weight > self.postings[token].get(doc_id, 0):
+                        self.postings[token][doc_id] = weight
+        self.postings = dict(self.postings)
+        # Sorted vocabulary for prefix ranges
+        self.vocab = sorted(self.postings)
+        # Typo lookups work on word starts too, so "publsh" still finds
+        # "publishing" mid-typing. prefix -> full terms, then
+        # "prefix minus one char" -> prefixes (SymSpell-style deletes)
+        self.prefixes = defaultdict(set)
+        for term in self.vocab:
+            for end in range(MIN_FUZZY_LEN, len(term) + 1):
+                self.prefixes[term[:end]].add(term)
+        self.prefixes = dict(self.prefixes)
+        self.deletes = defaultdict(set)
+        for prefix in self.prefixes:
+            for d in _deletes(prefix):
+                self.deletes[d].add(prefix)
+        self.deletes = dict(self.deletes)
+
+    # --- TERM EXPANSION ---
+    def _prefix_terms(self, token):
+        if len(token) < MIN_PREFIX_LEN:
+            return []
+        start = bisect.bisect_left(self.vocab, token)
+        end = bisect.bisect_left(self.vocab, token + "\x7f")
+        return [t for t in self.vocab[start:end] if t != token]
+
+    def _fuzzy_terms(self, token):
+        if len(token) < MIN_FUZZY_LEN:
+            return set()
+        near = set(self.deletes.get(token, ()))            # query is missing a letter
+        for d in _deletes(token):
+            if d in self.prefixes:
+                near.add(d)                                # query has an extra letter
+            near |= self.deletes.get(d, set())             # swapped / substituted letter
+        found = set()
+        for prefix in near:
+            found |= self.prefixes[prefix]
+        found.discard(token)
+        return found
+
+    def _expand(self, token):
+        # term -> score factor, best match kind wins
+        terms = {}
+        for t in self._fuzzy_terms(token):
+            terms[t] = FUZZY_FACTOR
+        for t in self._prefix_terms(token):
+            terms[t] = PREFIX_FACTOR
+        if token in self.postings:
+            terms[token] = 1.0
+        return terms
+
+    # --- QUERY ---
+    def search(self, query, limit=None):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        scores = defaultdict(float)
+        matched = defaultdict(int)
+        for token in tokens:
+            best = {}
+            for term, factor in self._expand(token).items():
+                for doc_id, weight in self.postings[term].items():
+                    best[doc_id] = max(best.get(doc_id, 0), weight * factor)
+            for doc_id, score in best.items():
+                scores[doc_id] += score
+                matched[doc_id] += 1
+
+        # Every word must match somewhere; if nothing does, fall back to
+        # "most words matched" so a half-right query still shows something
+        hits = [d for d in scores if matched[d] == len(tokens)] or list(scores)
+        hits.sort(key=lambda d: (-matched[d], -scores[d], self.docs[d]["title"]))
+        if limit:
+            hits = hits[:limit]
+        return [self.docs[d] for d in hits]
@@ -0,0 +1,133 @@
+from PIL import Image, ImageOps, ImageDraw, ImageFilter, ImageEnhance
+
+import image_cache
+
+# --- THE LIBRARY COMPOSITOR ---
+# The render stages behind mockup.py, kept out of the Streamlit script so they
+# can be imported on their own (bench_mockup.py drives them with no UI and no network).
+
+# --- 1. GET THE BACKGROUND (REAL LIBRARY) ---
+# A true "Dark Academia" library background (Bookshelves, warm light, wood)
+# This URL is specific to a dark library interior
+BG_URL = "https://images.unsplash.com/photo-1481627838653-40d7a4861bc7?q=80&w=1920&auto=format&fit=crop"
+
+# Everything besides the cover that changes the output. Part of the render
+# cache key, so bump RENDER_VERSION whenever the look of the scene changes.
+RENDER_VERSION = 1
+SCENE_PARAMS = {"version": RENDER_VERSION, "background": BG_URL, "format": "PNG"}
+
+def prepare_background(bg):
+    bg = bg.convert("RGBA")
+    # Blur it slightly to simulate "Portrait Mode" depth of field
+    bg = bg.filter(ImageFilter.GaussianBlur(3))
+    # Darken it slightly so the user's book pops
+    enhancer = ImageEnhance.Brightness(bg)
+    bg = enhancer.enhance(0.6)
+    return bg
+
+def load_background():
+    # -> (background, fell_back). Downloaded once into the local image cache,
+    # not on every render. A fallback render must not go into the render cache.
+    try:
+        bg = image_cache.load_original(BG_URL)
+        if bg is not None:
+            return prepare_background(bg), False
+    except OSError:
+        pass  # corrupt download
+    # Fallback if internet fails: Black background
+    return Image.new("RGBA", (1920, 1080), (20, 10, 5, 255)), True
+
+def get_background():
+    return load_background()[0]
+
+# --- 2. BUILD THE 3D BOOK OBJECT ---
+def create_3d_book(cover_img):
+    # Standardize size
+    w, h = 600, 900
+    cover = cover_img.resize((w, h), Image.Resampling.LANCZOS)
+
+    # Create Spine
+    spine_width = 50
+    spine = cover.crop((0, 0, spine_width, h))
+    spine = ImageOps.colorize(spine.convert("L"), black="#1a1a1a", white="#333")
+    spine = spine.resize((spine_width, h))
+
+    # Create Book Block
+    total_w = w + spine_width
+    book = Image.new("RGBA", (total_w + 30, h + 20), (0,0,0,0))
+
+    # Draw Page Block (The white paper edges)
+    draw = ImageDraw.Draw(book)
+    draw.rectangle([(spine_width + 5, 5), (total_w + 10, h - 5)], fill="#eee") # Pages
+
+    # Paste Spine & Cover
+    book.paste(spine, (0, 10))
+    book.paste(cover, (spine_width, 0))
+
+    return book
+
+# --- 3. THE REFLECTION ENGINE ---
+def add_reflection(book_img):
+    reflection = ImageOps.flip(book_img)
+    reflection = reflection.filter(ImageFilter.GaussianBlur(8))
+
+    # Create fade mask
+    mask = Image.new("L", book_img.size, 0)
+    draw = ImageDraw.Draw(mask)
+    # Stronger fade for a polished wood look
+    for y in range(book_img.height):
+        alpha = int(200 * (1 - (y / (book_img.height * 0.3))))
+        if alpha < 0: alpha = 0
+        draw.line([(0, y), (book_img.width, y)], fill=alpha)
+
+    reflection.putalpha(mask)
+    return reflection
+
+# --- 4. COMPOSITOR ---
+def composite_scene(user_cover, background=None):
+    # Pass a prepared background to skip the download (benchmarks, caching)
+    scene = background.copy() if background is not None else get_background()
+    scene_w, scene_h = scene.size
+
+    book = create_3d_book(user_cover)
+
+    # SCALING FIX: Make it 45% of screen height (Prevents cutting off)
+    target_h = int(scene_h * 0.45)
+    scale_factor = target_h / book.height
+    new_w = int(book.width * scale_factor)
+    new_h = int(book.height * scale_factor)
+    book = book.resize((new_w, new_h), Image.Resampling.LANCZOS)
+
+    # CENTERING FIX:
+    # X: Perfect center
+    # Y: Sitting in the bottom 3rd (on the table)
+    x_pos = (scene_w - new_w) // 2
+    y_pos = int(scene_h * 0.45) # Moves it up/down. 0.45 puts the base near the bottom third.
+
+    # Create Reflection & Shadow
+    reflection = add_reflection(book)
+    shadow = Image.new("RGBA", (new_w, 20), (0,0,0, 160))
+    shadow = shadow.filter(ImageFilter.GaussianBlur(15))
+
+    # COMPOSITE LAYERS
+    # 1. Reflection (Below the book)
+    scene.paste(reflection, (x_pos, y_pos + new_h - 5), mask=reflection)
+    # 2. Shadow (Under the base)
+    scene.paste(shadow, (x_pos, y_pos + new_h - 10), mask=shadow)
+    # 3. The Book
+    scene.paste(book, (x_pos, y_pos), mask=book)
+
+    # 4. LIGHTING OVERLAY (Vignette)
+    # Darken edges to focus on book
+    # We cheat a vignette with a dark overlay and a blurred hole cut out
+    dark_layer = Image.new("RGBA", scene.size, (0,0,0, 100))
+    mask = Image.new("L", scene.size, 0)
+    draw = ImageDraw.Draw(mask)
+    # Draw hole
+    center_x, center_y = x_pos + new_w//2, y_pos + new_h//2
+    draw.ellipse([(center_x - 600, center_y - 600), (center_x + 600, center_y + 600)], fill=255)
+    mask = mask.filter(ImageFilter.GaussianBlur(150))
+
+    scene = Image.composite(scene, Image.alpha_composite(scene, dark_layer), mask)
+
+    return scene
@@ -0,0 +1,133 @@
+import html
+import re
+
+# --- FUNNEL CONTENT ---
+# Everything the sales page says, in one place. funnel.py renders it with
+# Streamlit; build_funnel.py renders the same copy to a static HTML bundle.
+# Edit the copy here and both stay in sync.
+
+# --- YOUR GUMROAD LINK ---
+GUMROAD_LINK = "https://rhythmlogic.gumroad.com/l/dldqoy"
+
+PAGE_TITLE = "Rhythm Logic GPS - Pocket Publisher"
+PAGE_ICON = "🚀"
+
+HEADLINE = "STOP LOSING YOUR BEST IDEAS."
+SUB_HEADLINE = 'The AI "Pocket Publisher" that turns your messy voice notes into polished books, lyrics, and content—instantly.'
+
+# --- THE VIDEO PLAYER ---
+# 1. Upload your video to YouTube (set as "Unlisted") and paste the link here.
+# OR
+# 2. Upload a file named 'demo.mp4' to your GitHub repo and change this to "demo.mp4"
+# REPLACE THIS LINK WITH YOUR OWN VIDEO
+VIDEO_URL = "https://www.youtube.com/watch?v=O__reqiqvrM"
+
+CTA_PRIMARY = "👉 GET INSTANT ACCESS"
+CTA_SECONDARY = "👉 START CREATING NOW"
+CTA_NOTE = "Instant Activation • Cancel Anytime"
+
+# --- THE PROBLEM / AGITATION ---
+PROBLEM_IMAGE = "https://images.unsplash.com/photo-1516387938699-a93567ec168e?q=80&w=2071&auto=format&fit=crop"
+PROBLEM_IMAGE_CAPTION = "The Old Way"
+PROBLEM_IMAGE_WIDTH = 900
+PROBLEM_TITLE = "❌ The Problem: Friction Kills Creativity."
+PROBLEM_PARAGRAPHS = [
+    "You're driving. You're walking the dog. You're lying in bed.",
+    "**BAM.** A million-dollar idea hits you.",
+    "But by the time you unlock your phone, open your notes app, and try to type it out with your thumbs... **the magic is gone.**",
+    "Typing on glass is slow. It's tedious. And it's stopping you from finishing your book or song.",
+]
+
+# --- THE SOLUTION ---
+SOLUTION_TITLE = "✅ The Solution: Rhythm Logic GPS"
+SOLUTION_TAGLINE = "It listens. It understands. It writes."
+FEATURES = [
+    {"icon": "📖", "title": "Book Chapters",
+     "text": "Ramble about your plot for 2 minutes. Get back a structured, professionally written chapter draft."},
+    {"icon": "🎵", "title": "Songwriter Mode",
+     "text": 'Sing "bop bop bee doo" and tell it the vibe. It writes the lyrics, rhyme scheme, and structure.'},
+    {"icon": "🎬", "title": "The Director's Chair",
+     "text": 'Don\'t like the draft? Just tell it: "Make it darker" or "Add a bridge," and it rewrites it instantly.'},
+]
+
+# --- THE OFFER STACK (The "No-Brainer") ---
+STACK_TITLE = "📦 What You Get Today"
+STACK_ITEMS = [
+    ("📱", "Rhythm Logic Mobile Studio", "($20/mo Value)"),
+    ("🤖", 'The "Director\'s Chair" Engine', "($15/mo Value)"),
+    ("⚡", 'Unlimited "Spark" Ideas', "($10/mo Value)"),
+    ("🔒", "Secure Cloud Storage", "(Included)"),
+    ("🎁", 'BONUS: "Dictate Your Book" PDF Guide', "($27 Value)"),
+]
+TOTAL_VALUE = "$72/month"
+PRICE = "$20"
+PRICE_PERIOD = "/month"
+
+# --- FAQ ---
+FAQ_TITLE = "❓ Frequently Asked Questions"
+FAQ = [
+    ("Does this work on iPhone and Android?", "Yes. It runs directly in your browser. No app store download required."),
+    ("Is my voice data private?", "Yes. We use your secure API key. Your ideas stay yours."),
+    ("Can I cancel anytime?", "Absolutely. Cancel via Gumroad in 1 click."),
+]
+
+FOOTER = "© 2026 Rhythm Logic Publishing"
+
+# --- HTML SNIPPETS ---
+# Shared by st.markdown(..., unsafe_allow_html=True) and the static build.
+esc = html.escape
+
+def bold_to_html(text):
+    # The copy only uses **bold**; escape everything else
+    return re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", esc(text, quote=False))
+
+def hero_html():
+    return f"""
+<div class='hero-container'>
+    <div class='main-headline'>{esc(HEADLINE)}</div>
+    <div class='sub-headline'>{esc(SUB_HEADLINE, quote=False)}</div>
+</div>
+"""
+
+def cta_html(label, note=None):
+    note_html = f'<p style="color: #666; font-size: 14px;">{esc(note)}</p>' if note else ""
+    return f"""
+<div class='hero-container'>
+    <a href="{esc(GUMROAD_LINK)}" target="_blank" class="cta-button">{esc(label)}</a>
+    {note_html}
+</div>
+"""
+
+def feature_card_html(feature):
+    return f"""
+<div class='feature-card'>
+    <div class='feature-icon'>{feature['icon']}</div>
+    <div class='feature-title'>{esc(feature['title'], quote=False)}</div>
+    <p>{esc(feature['text'], quote=False)}</p>
+</div>
+"""
+
+def stack_html():
+    items = "\n".join(
+        f"<div class='stack-item'>{icon} <b>{esc(name, quote=False)}</b> <span class='stack-value'>{esc(value)}</span></div>"
+        for icon, name, value in STACK_ITEMS
+    )
+    return f"""
+<div class='stack-container'>
+<h2 style='text-align: center; color: white; text-transform: uppercase;'>{esc(STACK_TITLE)}</h2>
+<br>
+{items}
+<div class='total-price'>Total Value: <span style='text-decoration: line-through; color: #888;'>{esc(TOTAL_VALUE)}</span></div>
+<div class='real-price'>ONLY {esc(PRICE)}<span style='font-size: 20px; color: #aaa;'>{esc(PRICE_PERIOD)}</span></div>
+<div style='text-align: center;'>
+<a href="{esc(GUMROAD_LINK)}" target="_blank" class="cta-button">{esc(CTA_SECONDARY)}</a>
+</div>
+</div>
+"""
+
+def footer_html():
+    return f"<br><br><p style='text-align: center; color: #444;'>{esc(FOOTER)}</p>"
+
+def youtube_id(url):
+    m = re.search(r"(?:v=|youtu\.be/|embed/)([\w-]{11})", url)
+    return m.group(1) if m else None
@@ -1,94 +1,56 @@
 import streamlit as st
 
+import profiling
+import theme
+from catalog import load_catalog
+from image_cache import thumbnails
+
 # --- PAGE CONFIGURATION ---
 st.set_page_config(page_title="Cody Germain | Official Hub", page_icon="👑", layout="wide")
 
 # --- CUSTOM CSS (The "Empire" Theme) ---
-st.markdown("""
-<style>
-    /* GLOBAL THEME */
-    .stApp { background-color: #050505; color: white; }
-    h1, h2, h3 { font-family: 'Helvetica Neue', sans-serif; text-transform: uppercase; letter-spacing: 1px; }
-    h1 { color: #d4af37; font-weight: 900; }
-    h2 { color: white; border-bottom: 2px solid #333; padding-bottom: 10px; }
-    a { text-decoration: none; }
-
-    /* CARDS */
-    .app-card {
-        background-color: #1a1a1a;
-        border: 1px solid #333;
-        border-radius: 12px;
-        padding: 20px;
-        height: 240px; 
-        transition: all 0.3s ease;
-        display: flex;
-        flex-direction: column;
-        justify-content: space-between;
-    }
-    .app-card:hover {
-        transform: translateY(-5px);
-        border-color: #d4af37;
-        box-shadow: 0 10px 20px rgba(212, 175, 55, 0.1);
-    }
-    .card-title { font-size: 18px; font-weight: bold; color: #fff; margin-bottom: 5px; }
-    .card-desc { font-size: 13px; color: #aaa; margin-bottom: 15px; line-height: 1.4; }
-    
-    /* BADGES */
-    .badge-ent { background-color: #444; color: #d4af37; padding: 2px 8px; border-radius: 4px; font-size: 10px; font-weight: bold; border: 1px solid #d4af37; }
-    .badge-app { background-color: #222; color: #ccc; padding: 2px 8px; border-radius: 4px; font-size: 10px; font-weight: bold; }
-
-    /* BUTTONS */
-    .action-btn {
-        background-color: #d4af37;
-        color: black;
-        text-align: center;
-        padding: 10px;
-        border-radius: 6px;
-        font-weight: bold;
-        display: block;
-        transition: background 0.2s;
-    }
-    .action-btn:hover { background-color: #fff; }
-    
-    /* HERO SECTION */
-    .hero {
-        text-align: center;
-        padding: 40px 20px;
-        background: radial-gradient(circle at center, #222 0%, #000 100%);
-        border-radius: 20px;
-        margin-bottom: 40px;
-        border: 1px solid #333;
-    }
-</style>
-""", unsafe_allow_html=True)
+theme.apply("hub")
 
 # ==========================================
 # 📂 YOUR REAL DATABASE
 # ==========================================
-
-# 1. SOFTWARE (From your Gumroad Screenshot)
-SOFTWARE = [
-    {"name": "RL Global Academy", "desc": "The Global Education Tool Free For The World Web App (Mobile or Desktop) .", "tag": "ENTERPRISE", "url": "https://rhythmlogicglobalacademy.streamlit.app/"},
-    {"name": "Rhythm Logic Software", "desc": "The Official Rhythm Logic Sales Page.", "tag": "ENTERPRISE", "url": "https://rhythmlogic.gumroad.com/?_gl=1*1ydx5o7*_ga*MTA1MTI1MTMxNi4xNzY5NDcyMDQ4*_ga_6LJN6D94N6*czE3Njk1NDc4NzMkbzUkZzEkdDE3Njk1NDc4NzgkajU1JGwwJGgw"},
-    {"name": "Rhythm Logic Publishing", "desc": "Fast Professional Full Stack Publishing Services", "tag": "ENTERPRISE", "url": "https://rhythmlogicpublishing.com/"},
-    {"name": "Rhythm Logic Mobile", "desc": "The Pocket Publisher. Write books on the go.", "tag": "ENTERPRISE", "url": "https://gpsv26-mobile.streamlit.app/"},
-    # 
-]
-
-# 2. BOOKS (From your WildWarp/BubbleBum Screenshots)
-BOOKS = [
-    {"title": "The Bluetooth Paradox", "series": "WildWarp Chronicles", "img": "https://m.media-amazon.com/images/I/81xlyd9y2FL._SL1500_.jpg", "url": "https://a.co/d/cjmKEPo"},
-    {"title": "The Quantum Corral", "series": "WildWarp Chronicles", "img": "https://m.media-amazon.com/images/I/81ywZpXuU5L._SL1500_.jpg", "url": "https://a.co/d/9Q5H9f0"},
-    {"title": "The Master Clock", "series": "WildWarp Chronicles", "img": "https://m.media-amazon.com/images/I/81ZAGR4W3LL._SL1500_.jpg", "url": "https://a.co/d/2UShIjq"},
-    {"title": "BubbleBum Universe", "series": "Kids Collection", "img": "https://ih0.redbubble.net/avatar.10585962.140x140.jpg", "url": "https://bubblebumbooks.com/"},
-]
-
-# 3. MERCH LINKS
-MERCH_LINKS = {
-    "Mila Moo": "https://www.redbubble.com/people/Bubblebum-Books/shop", 
-    "WildWarp": "https://bubblebumbooks.com/wildwarp-chronicles",
-    "Rhythm Logic": "https://rhythmlogic.gumroad.com/"  # <--- Pointing to Gumroad now
-}
+# Edit catalog.json to add software, books or merch; no deploy needed.
+# load_catalog() only re-reads the file when it changes, and the search index
+# is built once per catalog version and shared by every visitor's session.
+with profiling.section("catalog load"):
+    catalog = load_catalog()
+
+SOFTWARE = catalog.software        # 1. SOFTWARE (From your Gumroad Screenshot)
+BOOKS = catalog.books              # 2. BOOKS (From your WildWarp/BubbleBum Screenshots)
+MERCH = catalog.merch              # 3. MERCH
+
+# Cards per page. The grids only render the current page, so the page stays
+# fast as the catalog grows into the hundreds.
+PAGE_SIZE = {"software": 12, "books": 12, "merch": 9, "results": 12}
+# A 4-column tile is ~300px wide on desktop; 400 keeps it sharp on 2x phones
+COVER_THUMB_WIDTH = 400
+
+def paginate(items, key, per_page):
+    pages = max(1, -(-len(items) // per_page))
+    if pages == 1:
+        return items
+    page = st.selectbox("Page", range(1, pages + 1), key=f"page_{key}", label_visibility="collapsed",
+                        format_func=lambda p: f"Page {p} of {pages} ({len(items)} items)")
+    start = (page - 1) * per_page
+    return items[start:start + per_page]
+
+def render_card(title, tag, desc, url, button):
+    tag_class = "badge-ent" if tag == "ENTERPRISE" else "badge-app"
+    st.markdown(f"""
+    <div class='app-card'>
+        <div>
+            <div class='card-title'>{title}</div>
+            <span class='{tag_class}'>{tag}</span>
+            <div class='card-desc' style='margin-top: 10px;'>{desc}</div>
+        </div>
+        <a href="{url}" target="_blank" class="action-btn">{button}</a>
+    </div>
+    """, unsafe_allow_html=True)
 
 # ==========================================
 # 🖥️ THE FRONT END
@@ -117,33 +79,38 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# --- SEARCH (Software, Books & Merch) ---
+search = st.text_input("🔍 Search Tools, Books & Merch...", placeholder="e.g. Enterprise, WildWarp, Mila Moo")
+if search.strip():
+    with profiling.section("catalog search"):
+        results = catalog.search_index.search(search)
+    st.markdown(f"### 🔍 {len(results)} result{'' if len(results) == 1 else 's'} for “{search.strip()}”")
+    if not results:
+        st.caption("Nothing matched. Try a shorter word or a book series name.")
+    r_cols = st.columns(3)
+    for i, doc in enumerate(paginate(results, f"results_{search.strip().lower()}", PAGE_SIZE["results"])):
+        item = doc['item']
+        with r_cols[i % 3]:
+            if doc['kind'] == "software":
+                render_card(item['name'], item['tag'], item['desc'], item['url'], "GET ACCESS ↗")
+            elif doc['kind'] == "book":
+                render_card(item['title'], "BOOK", item['series'], item['url'], "ORDER ↗")
+            else:
+                render_card(item.get('label', item['name']), "MERCH", item.get('desc', ""), item['url'], "SHOP ↗")
+    st.divider()
+
 # --- NAVIGATION TABS ---
 tabs = st.tabs(["💻 SOFTWARE SUITE", "📚 THE BOOKSTORE", "👕 MERCH SHOP"])
 
 # --- TAB 1: SOFTWARE (The 35 Titles) ---
 with tabs[0]:
-    c1, c2 = st.columns([3,1])
-    with c1: st.markdown("### ⚡ Enterprise & Creative Tools")
-    with c2: search = st.text_input("🔍 Search Tools...", placeholder="e.g. Enterprise")
-    
-    # Filter Logic
-    filtered_apps = [app for app in SOFTWARE if search.lower() in app['name'].lower() or search.lower() in app['desc'].lower()]
+    st.markdown("### ⚡ Enterprise & Creative Tools")
     
     # Grid Layout
     cols = st.columns(3)
-    for i, app in enumerate(filtered_apps):
+    for i, app in enumerate(paginate(SOFTWARE, "software", PAGE_SIZE["software"])):
         with cols[i % 3]:  # 
-            tag_class = "badge-ent" if app['tag'] == "ENTERPRISE" else "badge-app"
-            st.markdown(f"""
-            <div class='app-card'>
-                <div>
-                    <div class='card-title'>{app['name']}</div>
-                    <span class='{tag_class}'>{app['tag']}</span>
-                    <div class='card-desc' style='margin-top: 10px;'>{app['desc']}</div>
-                </div>
-                <a href="{app['url']}" target="_blank" class="action-btn">GET ACCESS ↗</a>
-            </div>
-            """, unsafe_allow_html=True)
+            render_card(app['name'], app['tag'], app['desc'], app['url'], "GET ACCESS ↗")
 
 # --- TAB 2: BOOKS (WildWarp & BubbleBum) ---
 with tabs[1]:
@@ -151,9 +118,12 @@ with tabs[1]:
     
     # Display Books in a 4-column grid
     b_cols = st.columns(4)
-    for i, book in enumerate(BOOKS):
+    page_books = paginate(BOOKS, "books", PAGE_SIZE["books"])
+    # Small local thumbnails instead of the 1500px Amazon originals
+    covers = thumbnails([book['img'] for book in page_books], COVER_THUMB_WIDTH)
+    for i, book in enumerate(page_books):
         with b_cols[i % 4]:
-            st.image(book['img'], use_container_width=True)
+            st.image(covers[i], use_container_width=True)
             st.markdown(f"**{book['title']}**")
             st.caption(book['series'])
             st.markdown(f"[Order on Amazon]({book['url']})")
@@ -162,14 +132,8 @@ with tabs[1]:
 with tabs[2]:
     st.markdown("### 🧢 Character Merchandise")
     
-    m1, m2, m3 = st.columns(3)
-    with m1:
-        st.info("**🐶 Mila Moo Collection**\nGear for dog lovers.")
-        st.link_button("Shop Redbubble", MERCH_LINKS["Mila Moo"])
-    with m2:
-        st.info("**💀 WildWarp Gear**\nSci-Fi apparel & accessories.")
-        st.link_button("Shop Amazon", MERCH_LINKS["WildWarp"])
-    with m3:
-        st.info("**🚀 Rhythm Logic Swag**\nOfficial brand merchandise.")
-        # This now correctly grabs the Gumroad link we defined above
-        st.link_button("Shop Gumroad", MERCH_LINKS["Rhythm Logic"])
\ No newline at end of file
+    m_cols = st.columns(3)
+    for i, item in enumerate(paginate(MERCH, "merch", PAGE_SIZE["merch"])):
+        with m_cols[i % 3]:
+            st.info(f"**{item.get('label', item['name'])}**\n{item.get('desc', '')}")
+            st.link_button(item.get('button', "Shop Now"), item['url'])
\ No newline at end of file
@@ -0,0 +1,251 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# --- IMAGE PROXY + THUMBNAIL CACHE ---
+# Remote images (Amazon covers, Unsplash photos) are downloaded once into a
+# disk cache, revalidated in the background with ETag / Last-Modified after
+# MAX_AGE (the stale copy is served meanwhile, never waited on), and resized
+# into small WebP thumbnails (plus a JPEG fallback) so the grids ship ~30 KB
+# tiles instead of 1500px originals.
+#
+#   thumbnail(url, 400)      -> local path of a 400px-wide thumbnail
+#   thumbnail_set(url, 400)  -> {"webp": path, "jpeg": path} for <picture> tags
+#   original(url)            -> local path of the full-size download
+#
+# If the network is down, stale copies are served; if there is no copy at
+# all, the functions hand back the remote URL so st.image still shows it.
+# A failed fetch is remembered for FAILURE_TTL, so reruns in the meantime
+# answer straight away instead of waiting out TIMEOUT again.
+#
+# requests and PIL are imported on first use: a page whose thumbnails are all
+# cached already only does a few os.path.exists() calls.
+
+CACHE_DIR = ".image_cache"
+MAX_AGE = 24 * 60 * 60          # seconds before a cached original is revalidated
+TIMEOUT = 10
+FAILURE_TTL = 60                # seconds a failed fetch is remembered (no retry on every rerun)
+JPEG_QUALITY = 82
+WEBP_QUALITY = 80
+USER_AGENT = "Mozilla/5.0 (compatible; RhythmLogicImageCache/1.0)"
+
+log = logging.getLogger(__name__)
+
+_session = None
+_failures = {}   # url key -> time.monotonic() of the last failed fetch
+_locks = {}
+_locks_guard = threading.Lock()
+_revalidator = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-revalidate")
+
+def _lock_for(key):
+    # One lock per URL so two sessions don't download the same cover twice
+    with _locks_guard:
+        return _locks.setdefault(key, threading.Lock())
+
+def _get_session():
+    # One pooled session for the process, so repeat fetches reuse connections
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+        _session.headers["User-Agent"] = USER_AGENT
+    return _session
+
+def _url_key(url):
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+
+def _paths(url):
+    key = _url_key(url)
+    return key, os.path.join(CACHE_DIR, f"{key}.orig"), os.path.join(CACHE_DIR, f"{key}.json")
+
+def _write_atomic(path, data):
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+# --- ORIGINALS ---
+def _recently_failed(key):
+    failed_at = _failures.get(key)
+    return failed_at is not None and time.monotonic() - failed_at < FAILURE_TTL
+
+def original(url):
+    key, orig_path, meta_path = _paths(url)
+    if _recently_failed(key) and not os.path.exists(orig_path):
+        return None  # host was just unreachable: don't block this rerun on it again
+    meta = _read_meta(meta_path)
+    if meta is not None and os.path.exists(orig_path):
+        if time.time() - meta["checked"] >= MAX_AGE and not _recently_failed(key):
+            _revalidate_later(url)
+        return orig_path  # stale or not, the page gets what we have right now
+    with _lock_for(key):
+        # First download: there's nothing to serve yet, so this one has to wait
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+        except OSError as e:
+            log.warning("Image cache unavailable: %s", e)
+            return None
+        meta = _read_meta(meta_path)
+        if meta is not None and os.path.exists(orig_path):
+            return orig_path  # another thread fetched it while we waited for the lock
+        if _recently_failed(key):
+            return None  # another thread failed while we waited for the lock
+        return _fetch(url, key, orig_path, meta_path, None)
+
+def _revalidate_later(url):
+    # Holding the URL's lock from here until the background fetch ends means a
+    # busy grid queues one revalidation per URL, not one per rerun
+    lock = _lock_for(_url_key(url))
+    if not lock.acquire(blocking=False):
+        return  # already being fetched
+    try:
+        _revalidator.submit(_revalidate, url, lock)
+    except RuntimeError:  # interpreter shutting down
+        lock.release()
+
+def _revalidate(url, lock):
+    try:
+        key, orig_path, meta_path = _paths(url)
+        meta = _read_meta(meta_path)
+        if meta is not None and os.path.exists(orig_path) and time.time() - meta["checked"] >= MAX_AGE:
+            _fetch(url, key, orig_path, meta_path, meta)
+    finally:
+        lock.release()
+
+def _fetch(url, key, orig_path, meta_path, meta):
+    # Conditional GET when we already have a copy (meta), plain GET otherwise.
+    # Call with the URL's lock held. -> orig_path, or None if there's no copy.
+    import requests
+
+    have_copy = meta is not None
+    headers = {}
+    if have_copy:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    try:
+        r = _get_session().get(url, headers=headers, timeout=TIMEOUT)
+        if r.status_code == 304 and have_copy:
+            meta["checked"] = time.time()
+        else:
+            r.raise_for_status()
+            _write_atomic(orig_path, r.content)
+            meta = {
+                "url": url,
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "content_type": r.headers.get("Content-Type"),
+                "digest": hashlib.sha256(r.content).hexdigest()[:16],
+                "checked": time.time(),
+            }
+        _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        _failures.pop(key, None)
+    except (requests.RequestException, OSError) as e:
+        _failures[key] = time.monotonic()
+        if not have_copy:
+            log.warning("Image fetch failed for %s: %s", url, e)
+            return None
+        log.info("Image revalidation failed for %s, serving stale copy: %s", url, e)
+    return orig_path
+
+# --- THUMBNAILS ---
+_webp = None
+
+def webp_supported():
+    global _webp
+    if _webp is None:
+        from PIL import features
+        _webp = features.check("webp")
+    return _webp
+
+def _thumb_path(url, digest, width, ext):
+    # The content digest is part of the name, so a changed original gets new
+    # thumbnails automatically and stale ones are never served
+    return os.path.join(CACHE_DIR, f"{_url_key(url)}-{digest}-w{width}.{ext}")
+
+def _drop_stale_thumbs(url, digest):
+    # Thumbnails of an older version of this image are never served again
+    prefix, keep = f"{_url_key(url)}-", f"{_url_key(url)}-{digest}-"
+    try:
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith(prefix) and not name.startswith(keep):
+                os.remove(os.path.join(CACHE_DIR, name))
+    except OSError:
+        pass
+
+def _render_thumbs(orig_path, paths, width):
+    from PIL import Image
+
+    with Image.open(orig_path) as img:
+        img.load()
+        if img.width > width:
+            height = round(img.height * width / img.width)
+            img = img.resize((width, height), Image.Resampling.LANCZOS)
+        if "webp" in paths:
+            img.save(paths["webp"], format="WEBP", quality=WEBP_QUALITY, method=4)
+        # JPEG has no alpha; flatten onto the dark site background
+        if img.mode in ("RGBA", "LA", "P"):
+            rgba = img.convert("RGBA")
+            img = Image.new("RGB", rgba.size, (5, 5, 5))
+            img.paste(rgba, mask=rgba.split()[-1])
+        img.convert("RGB").save(paths["jpeg"], format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+
+def thumbnail_set(url, width):
+    orig_path = original(url)
+    if orig_path is None:
+        return None
+    meta = _read_meta(_paths(url)[2]) or {}
+    digest = meta.get("digest", "0")
+    paths = {"jpeg": _thumb_path(url, digest, width, "jpg"),
+             "webp": _thumb_path(url, digest, width, "webp")}
+    if all(os.path.exists(p) for p in paths.values()):
+        return paths  # the common case: no PIL needed at all
+    if not webp_supported():
+        del paths["webp"]
+    with _lock_for(f"{url}@{width}"):
+        if not all(os.path.exists(p) for p in paths.values()):
+            try:
+                _render_thumbs(orig_path, paths, width)
+            except (OSError, ValueError) as e:  # not an image / truncated download
+                log.warning("Thumbnail failed for %s: %s", url, e)
+                return None
+            _drop_stale_thumbs(url, digest)
+    return paths
+
+def thumbnail(url, width):
+    # Best single file for st.image: WebP when Pillow can write it, else JPEG.
+    # Falls back to the remote URL so the page never shows a broken image.
+    paths = thumbnail_set(url, width)
+    if not paths:
+        return url
+    return paths.get("webp", paths["jpeg"])
+
+def thumbnails(urls, width, max_workers=8):
+    # A grid page's worth in parallel; first visitor after a deploy pays one
+    # round trip instead of one per cover
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda u: thumbnail(u, width), urls))
+
+def load_original(url):
+    # PIL image of the full-size original, or None if it can't be fetched
+    from PIL import Image
+
+    path = original(url)
+    if path is None:
+        return None
+    with open(path, "rb") as f:
+        return Image.open(io.BytesIO(f.read()))
@@ -0,0 +1,144 @@
+import html
+import io
+import json
+import re
+import time
+import zipfile
+
+# --- OFFLINE LESSON PACKS ---
+# A term's worth of lessons in one small download for schools on slow, pricey
+# mobile data. Teachers download it once over wifi and use it offline. A pack
+# is a plain .zip (every phone can open one) holding:
+#
+#     index.html     self-contained viewer: data, CSS and JS inline, no network
+#     lessons.json   the same lessons as structured text, for reuse / printing
+#     pdf/*.pdf      optional pre-rendered lesson plans
+#
+# Zip entries carry a fixed timestamp, so rebuilding a pack the same day
+# gives the same bytes.
+
+PACK_VERSION = 1
+MAX_LESSONS = 20
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+# --- STRUCTURE ---
+def slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")[:40] or "lesson"
+
+def lesson_record(text, subject, age, region, topic):
+    return {
+        "topic": topic.strip() or subject,
+        "subject": subject,
+        "age": age,
+        "region": region,
+        "text": text,   # markdown, exactly as the teacher saw it on screen
+    }
+
+def pack_name(region, subject, age):
+    return f"pocket_school_{slug(region)}_{slug(subject)}_{slug(age)}.zip"
+
+def pack_data(lessons, region, subject, age):
+    return {
+        "format": "pocket-school-pack",
+        "version": PACK_VERSION,
+        "created": time.strftime("%Y-%m-%d"),
+        "region": region,
+        "subject": subject,
+        "age": age,
+        "lessons": lessons,
+    }
+
+# --- VIEWER ---
+VIEWER_CSS = """
+*{box-sizing:border-box}body{margin:0;font-family:Georgia,serif;background:#f4f1ea;color:#222;line-height:1.6}
+header{background:#1f3b2d;color:#fff;padding:14px 18px}header h1{margin:0;font-size:20px}header p{margin:2px 0 0;font-size:13px;opacity:.8}
+nav{display:flex;flex-wrap:wrap;gap:6px;padding:12px 18px;border-bottom:1px solid #ddd}
+nav a{padding:6px 10px;border-radius:6px;background:#fff;border:1px solid #ccc;color:#1f3b2d;text-decoration:none;font-size:14px}
+nav a.on{background:#1f3b2d;color:#fff}
+article{max-width:760px;margin:0 auto;padding:18px;background:#fff;min-height:60vh}
+h2,h3,h4{color:#1f3b2d}.meta{color:#666;font-size:14px}.tools a{margin-right:14px;font-size:14px}
+@media print{nav,header,.tools{display:none}article{max-width:none}}
+"""
+
+VIEWER_JS = """
+var pack=JSON.parse(document.getElementById('pack').textContent);
+function esc(s){return s.replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;');}
+function inline(s){return esc(s).replace(/\\*\\*(.+?)\\*\\*/g,'<b>$1</b>').replace(/\\*(.+?)\\*/g,'<i>$1</i>');}
+function md(text){
+  var html='',list=false;
+  text.split(/\\r?\\n/).forEach(function(line){
+    var t=line.trim(),m;
+    if((m=t.match(/^[-*]\\s+(.*)$/))){if(!list){html+='<ul>';list=true;}html+='<li>'+inline(m[1])+'</li>';return;}
+    if(list){html+='</ul>';list=false;}
+    if(!t)return;
+    if((m=t.match(/^(#{1,5})\\s+(.*)$/))){var n=m[1].length+1;html+='<h'+n+'>'+inline(m[2])+'</h'+n+'>';}
+    else html+='<p>'+inline(t)+'</p>';
+  });
+  return html+(list?'</ul>':'');
+}
+function show(){
+  var i=parseInt(location.hash.slice(1),10)||0;
+  if(i<0||i>=pack.lessons.length)i=0;
+  var l=pack.lessons[i],tools='<a href="#" onclick="window.print();return false">Print</a>';
+  if(l.pdf)tools+='<a href="'+esc(l.pdf)+'">PDF</a>';
+  document.querySelector('article').innerHTML='<h2>'+esc(l.topic)+'</h2><p class="meta">'+esc(l.subject)+' | '+esc(l.age)+' | '+esc(l.region)+'</p><p class="tools">'+tools+'</p>'+md(l.text);
+  document.querySelectorAll('nav a').forEach(function(a,j){a.className=j===i?'on':'';});
+  window.scrollTo(0,0);
+}
+document.querySelector('nav').innerHTML=pack.lessons.map(function(l,i){return '<a href="#'+i+'">'+(i+1)+'. '+esc(l.topic)+'</a>';}).join('');
+window.addEventListener('hashchange',show);show();
+"""
+
+def _minify(code):
+    return re.sub(r"\s*\n\s*", "", code).strip()
+
+def viewer_html(data):
+    # "</" can't appear inside a <script> block
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+    title = f"The Pocket School | {data['subject']} | {data['region']}"
+    esc = html.escape
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f'<title>{esc(title)}</title><style>{_minify(VIEWER_CSS)}</style></head><body>'
+        f'<header><h1>🌍 {esc(title)}</h1><p>{len(data["lessons"])} lessons | {esc(data["age"])} | '
+        'works offline</p></header><nav></nav><article></article>'
+        f'<script type="application/json" id="pack">{payload}</script>'
+        f'<script>{_minify(VIEWER_JS)}</script></body></html>'
+    )
+
+# --- PACK ---
+def build_pack(lessons, region, subject, age, make_pdf=None):
+    # -> (zip bytes, {name: (raw bytes, compressed bytes)})
+    lessons = [dict(l) for l in lessons[:MAX_LESSONS]]
+    pdfs = {}
+    if make_pdf:
+        for i, lesson in enumerate(lessons, 1):
+            name = f"pdf/{i:02d}-{slug(lesson['topic'])}.pdf"
+            pdfs[name] = make_pdf(lesson["text"], lesson["subject"], lesson["age"], lesson["region"])
+            lesson["pdf"] = name
+    data = pack_data(lessons, region, subject, age)
+
+    files = {
+        "index.html": viewer_html(data).encode("utf-8"),
+        "lessons.json": json.dumps(data, ensure_ascii=False, indent=1).encode("utf-8"),
+    }
+    files.update(pdfs)
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, raw in files.items():
+            info = zipfile.ZipInfo(name, date_time=ZIP_DATE)
+            info.external_attr = 0o644 << 16
+            # PDFs are already deflated inside; squeezing them again only costs time
+            if name.endswith(".pdf"):
+                info.compress_type = zipfile.ZIP_STORED
+                zf.writestr(info, raw)
+            else:
+                info.compress_type = zipfile.ZIP_DEFLATED
+                zf.writestr(info, raw, compresslevel=9)
+        sizes = {i.filename: (i.file_size, i.compress_size) for i in zf.infolist()}
+    return buf.getvalue(), sizes
+
+def size_label(n):
+    return f"{n / 1024:.1f} KB" if n < 1024 * 1024 else f"{n / (1024 * 1024):.2f} MB"
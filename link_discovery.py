@@ -0,0 +1,209 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from catalog import load_catalog
+
+# --- LINK DISCOVERY ---
+# Finds every outbound URL the apps actually use, so the auditor checks the
+# real set instead of a hand-pasted list that drifts:
+#   - catalog.json (software, book covers + store links, merch)
+#   - URLs written into the hub, funnel and mockup pages
+# URLs are normalised and deduplicated, each one's redirect chain is followed
+# once and cached, and every unique final endpoint is probed exactly once.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PAGE_SOURCES = ["hub.py", "funnel.py", "funnel_content.py", "mockup.py", "compositor.py"]
+
+RESOLVE_CACHE = os.path.join(HERE, ".link_cache.json")
+RESOLVE_TTL = 24 * 60 * 60   # re-follow redirects once a day
+TIMEOUT = 5
+MAX_WORKERS = 8
+
+# Query params that only track the click; dropping them merges duplicates
+TRACKING_PARAMS = {"_gl", "_ga", "gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "igshid", "ref_src"}
+TRACKING_PREFIXES = ("utm_",)
+
+# User-Agent makes us look like a real Chrome browser
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+URL_RE = re.compile(r"https?://[^\s\"'<>)\]}]+")
+
+# --- NORMALISE ---
+def normalize(url):
+    url = url.strip()
+    if not url:
+        return None
+    if "://" not in url:
+        url = "https://" + url   # bare host, e.g. "Bubblebum-Books.redbubble.com"
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if not host or any(c.isspace() for c in host) or ("." not in host and host != "localhost"):
+        return None  # not a link, e.g. a stray note pasted into the list
+    try:
+        port = parts.port
+    except ValueError:
+        return None  # junk after the colon
+    if port and not ((scheme == "https" and port == 443) or (scheme == "http" and port == 80)):
+        host = f"{host}:{port}"
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)]
+    # Fragments never reach the server
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query, safe="*,/:"), ""))
+
+# --- DISCOVER ---
+def catalog_urls(catalog=None):
+    catalog = catalog or load_catalog()
+    for app in catalog.software:
+        yield app["url"], f"catalog: {app['name']}"
+    for book in catalog.books:
+        yield book["url"], f"catalog: {book['title']}"
+        yield book["img"], f"catalog: {book['title']} (cover)"
+    for item in catalog.merch:
+        yield item["url"], f"catalog: {item['name']} merch"
+
+def page_urls(files=PAGE_SOURCES):
+    for name in files:
+        path = os.path.join(HERE, name)
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            continue
+        for match in URL_RE.finditer(text):
+            url = match.group(0).rstrip(".,;")
+            if "{" in url:
+                continue  # f-string template, not a real link
+            yield url, name
+
+def discover(extra=()):
+    # -> {normalized_url: [where it was found, ...]} in first-seen order
+    found = {}
+    sources = list(catalog_urls()) + list(page_urls()) + [(u, "extra") for u in extra]
+    for url, source in sources:
+        key = normalize(url)
+        if key and source not in found.setdefault(key, []):
+            found[key].append(source)
+    return found
+
+def dedupe(lines):
+    # Normalise pasted links; returns (unique urls in order, duplicates dropped, invalid lines)
+    seen = {}
+    duplicates = invalid = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        key = normalize(line)
+        if not key:
+            invalid += 1
+        elif key in seen:
+            duplicates += 1
+        else:
+            seen[key] = True
+    return list(seen), duplicates, invalid
+
+# --- RESOLVE + PROBE ---
+_cache_lock = threading.Lock()
+
+def _load_cache():
+    try:
+        with open(RESOLVE_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(RESOLVE_CACHE), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f, indent=1)
+        os.replace(tmp, RESOLVE_CACHE)
+    except OSError:
+        pass  # read-only deploy: resolution just isn't remembered
+
+def status_label(code):
+    if code is None:
+        return "💀 UNREACHABLE"
+    if code == 200:
+        return "🟢 LIVE"
+    if code == 404:
+        return "🔴 BROKEN (404)"
+    if code == 403:
+        return "🟠 BLOCKED (403)" # Site works but blocks bots
+    return f"⚠️ {code}"
+
+def probe(url, session, follow=True):
+    # -> (final url, status code or None). stream=True: headers only, no body download
+    try:
+        r = session.get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=follow, stream=True)
+        r.close()
+        return r.url, r.status_code
+    except Exception:
+        return url, None
+
+def audit(urls, session, progress=None):
+    # -> list of {"Link", "Resolves To", "Status", "Redirected"} rows, one per input url.
+    # progress(done, total, url) is called from this thread as results come in.
+    now = time.time()
+    with _cache_lock:
+        cache = _load_cache()
+
+    # 1. Follow redirect chains for links we haven't resolved recently.
+    #    The final response of that chain doubles as the endpoint's probe.
+    targets, statuses = {}, {}
+    to_resolve = []
+    for url in urls:
+        hit = cache.get(url)
+        if hit and now - hit["checked"] < RESOLVE_TTL:
+            targets[url] = hit["target"]
+        else:
+            to_resolve.append(url)
+
+    # 2. Probe each unique endpoint that step 1 didn't already hit
+    endpoints = sorted({targets[u] for u in targets})
+    total = len(to_resolve) + len(endpoints)
+    done = 0
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {pool.submit(probe, u, session): u for u in to_resolve}
+        for fut in as_completed(futures):
+            url = futures[fut]
+            final, code = fut.result()
+            final = normalize(final) or url
+            targets[url] = final
+            statuses[final] = code
+            if code is not None:
+                cache[url] = {"target": final, "checked": now}
+            done += 1
+            if progress:
+                progress(done, total, url)
+
+        pending = [t for t in endpoints if t not in statuses]
+        total = done + len(pending)
+        futures = {pool.submit(probe, t, session): t for t in pending}
+        for fut in as_completed(futures):
+            target = futures[fut]
+            statuses[target] = fut.result()[1]
+            done += 1
+            if progress:
+                progress(done, total, target)
+
+    with _cache_lock:
+        _save_cache(cache)
+
+    return [
+        {
+            "Link": url,
+            "Resolves To": targets[url],
+            "Status": status_label(statuses.get(targets[url])),
+            "Redirected": targets[url] != url,
+        }
+        for url in urls
+    ]
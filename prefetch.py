@@ -0,0 +1,80 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# --- PREFETCH (studio) ---
+# Work we can start before the user clicks, because steps 1 and 2 already
+# told us what they're writing:
+#   - prewarm(): open the HTTPS connection to OpenRouter (DNS + TCP + TLS) in
+#     the background, so the real call reuses a live socket
+#   - speculate(): stream a short generation in the background that can be
+#     cancelled at any time; the first real generation picks it up if it's
+#     still relevant
+# Nothing here touches Streamlit; app.py keeps the handles in session_state.
+
+# Both pools are shared by every session on the host. Threads here only wait
+# on the network, so the speculation pool is sized for a busy host rather
+# than for CPUs; prewarm pings get their own small pool so a visitor's
+# connection setup never queues behind other visitors' outlines.
+SPECULATION_WORKERS = 16
+_pool = ThreadPoolExecutor(max_workers=SPECULATION_WORKERS, thread_name_prefix="prefetch")
+_warm_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prewarm")
+
+def prewarm(client):
+    # Cheap authenticated GET: proves the key and leaves a pooled keep-alive
+    # connection behind. Failures don't matter, the real call will report them.
+    def ping():
+        try:
+            import httpx
+            client.with_options(max_retries=0, timeout=5).get("/key", cast_to=httpx.Response)
+        except Exception:
+            pass
+    return _warm_pool.submit(ping)
+
+class Speculation:
+    def __init__(self, key):
+        self.key = key            # what it was started for, e.g. (mode, style)
+        self.text = ""            # grows as chunks arrive
+        self.cancelled = threading.Event()
+        self.future = None
+
+    def cancel(self):
+        # A queued speculation never starts; a running one stops at the next chunk
+        self.cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def take(self, min_lines=3):
+        # Never waits: -> (text, complete). The finished text, or what has
+        # streamed so far if it already holds min_lines complete lines, else
+        # (None, False). Either way the rest is cancelled so the real
+        # generation doesn't queue behind it.
+        if self.future.done() and not self.future.cancelled():
+            text, complete = self.future.result(), True
+        else:
+            partial = self.text.rsplit("\n", 1)[0] if "\n" in self.text else ""
+            lines = [l for l in partial.splitlines() if l.strip()]
+            text, complete = (partial.strip() if len(lines) >= min_lines else None), False
+        self.cancel()
+        return text, complete
+
+def _stream(spec, client, model, messages, max_tokens):
+    if spec.cancelled.is_set():
+        return None  # cancelled while queued: don't send a paid request
+    try:
+        stream = client.chat.completions.create(
+            model=model, messages=messages, max_tokens=max_tokens, stream=True,
+        )
+        with stream:
+            for chunk in stream:
+                if spec.cancelled.is_set():
+                    return None   # leaving the with-block closes the connection mid-stream
+                if chunk.choices and chunk.choices[0].delta.content:
+                    spec.text += chunk.choices[0].delta.content
+    except Exception:
+        return None
+    return None if spec.cancelled.is_set() else spec.text.strip() or None
+
+def speculate(key, client, model, messages, max_tokens=400):
+    spec = Speculation(key)
+    spec.future = _pool.submit(_stream, spec, client, model, messages, max_tokens)
+    return spec
@@ -0,0 +1,244 @@
+import atexit
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+# --- PROFILING (opt-in) ---
+# Streamlit reruns the whole script on every click, so a slow block is paid
+# over and over. Turn this on to see where a run's time and memory go:
+#
+#     RL_PROFILE=1 streamlit run streamlit_app.py
+#
+# then open Admin -> Profile. Pages mark their hot spots with
+#     with profiling.section("pdf build"): ...
+# and streamlit_app.py wraps each page run with profiling.run(page.title),
+# which also counts reruns per session. Standalone apps (streamlit run hub.py)
+# record their sections but not per-session reruns.
+#
+# Stats are kept in memory and merged into METRICS_PATH every few seconds
+# under a file lock, so every process and restart adds to the same file.
+# When RL_PROFILE is unset, section() and run() do nothing.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ENABLED = os.environ.get("RL_PROFILE", "").lower() in ("1", "true", "yes")
+METRICS_PATH = os.environ.get("RL_PROFILE_FILE") or os.path.join(HERE, ".metrics", "profile.json")
+FLUSH_EVERY = 5.0   # seconds between writes to METRICS_PATH
+RUN = "(whole run)"
+
+_lock = threading.Lock()
+_pending = {"sections": {}, "pages": {}}
+_last_flush = time.monotonic()
+_local = threading.local()   # the page the current script thread is running
+
+# --- MEMORY ---
+# The one RSS source for the admin pages (shared.py) and the benchmarks, so
+# they all agree about the same process. 0.0 means "no cheap source here".
+def rss_mb():
+    # What the process holds right now
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return 0.0  # no /proc (macOS, Windows): report nothing rather than guess
+
+def peak_rss_mb():
+    # The process high-water mark (ru_maxrss): catches spikes that are freed
+    # again before the section ends, which an RSS reading at the end misses
+    try:
+        import resource
+    except ImportError:
+        return 0.0  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def reset_peak():
+    # Drop the high-water mark to the current RSS (Linux only). -> True if it
+    # worked, so the next peak_rss_mb() covers only what runs after this call
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def _page_name():
+    page = getattr(_local, "page", None)
+    if page:
+        return page
+    # Standalone: `streamlit run hub.py` sets argv[0] to the script
+    return os.path.splitext(os.path.basename(sys.argv[0]))[0] or "script"
+
+# --- AGGREGATION ---
+def _merge_section(into, row):
+    into["calls"] = into.get("calls", 0) + row["calls"]
+    into["total_ms"] = round(into.get("total_ms", 0.0) + row["total_ms"], 2)
+    into["max_ms"] = round(max(into.get("max_ms", 0.0), row["max_ms"]), 2)
+    into["max_growth_mb"] = round(max(into.get("max_growth_mb", 0.0), row["max_growth_mb"]), 1)
+    into["peak_rss_mb"] = round(max(into.get("peak_rss_mb", 0.0), row["peak_rss_mb"]), 1)
+    into["raised_peak_mb"] = round(max(into.get("raised_peak_mb", 0.0), row["raised_peak_mb"]), 1)
+
+def _merge_page(into, row):
+    into["sessions"] = into.get("sessions", 0) + row["sessions"]
+    into["reruns"] = into.get("reruns", 0) + row["reruns"]
+    into["max_reruns_per_session"] = max(into.get("max_reruns_per_session", 0), row["max_reruns_per_session"])
+
+def _record(page, name, elapsed_ms, growth_mb, peak_mb, raised_mb):
+    row = {"calls": 1, "total_ms": elapsed_ms, "max_ms": elapsed_ms,
+           "max_growth_mb": growth_mb, "peak_rss_mb": peak_mb, "raised_peak_mb": raised_mb}
+    with _lock:
+        _merge_section(_pending["sections"].setdefault(page, {}).setdefault(name, {}), row)
+
+def _record_rerun(page, run_number):
+    row = {"sessions": 1 if run_number == 1 else 0, "reruns": 1, "max_reruns_per_session": run_number}
+    with _lock:
+        _merge_page(_pending["pages"].setdefault(page, {}), row)
+
+# --- HOOKS ---
+@contextmanager
+def section(name):
+    if not ENABLED:
+        yield
+        return
+    rss_before = rss_mb()
+    peak_before = peak_rss_mb()
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        peak = peak_rss_mb()
+        # growth: RSS still held at the end; raised: how far this section
+        # pushed the process peak (0 if it stayed under an earlier peak)
+        _record(_page_name(), name, elapsed_ms, max(rss_mb() - rss_before, 0.0),
+                peak, max(peak - peak_before, 0.0))
+        flush()
+
+@contextmanager
+def run(page):
+    # with profiling.run(page.title): page.run()
+    if not ENABLED:
+        yield
+        return
+    import streamlit as st
+    key = f"_profile_runs_{page}"
+    st.session_state[key] = st.session_state.get(key, 0) + 1
+    _record_rerun(page, st.session_state[key])
+
+    previous = getattr(_local, "page", None)
+    _local.page = page
+    try:
+        with section(RUN):
+            yield
+    finally:
+        # Runs on st.stop() / st.rerun() too (they unwind as exceptions)
+        _local.page = previous
+
+# --- METRICS FILE ---
+def load_metrics(path=None):
+    path = path or METRICS_PATH
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    data.setdefault("sections", {})
+    data.setdefault("pages", {})
+    return data
+
+def flush(force=False):
+    # Merge what this process has collected into the metrics file
+    global _last_flush
+    with _lock:
+        if not force and time.monotonic() - _last_flush < FLUSH_EVERY:
+            return
+        _last_flush = time.monotonic()
+        if not _pending["sections"] and not _pending["pages"]:
+            return
+        # Take the rows and let go of _lock: the file work below can wait on
+        # other processes' flock, and every section() exit needs _lock
+        taken = {"sections": _pending["sections"], "pages": _pending["pages"]}
+        _pending["sections"], _pending["pages"] = {}, {}
+    try:
+        os.makedirs(os.path.dirname(METRICS_PATH), exist_ok=True)
+        with _file_lock():
+            data = load_metrics()
+            _merge_into(data, taken)
+            data["updated"] = time.time()
+            _write_atomic(data)
+    except OSError:
+        # read-only deploy: put the numbers back, they're retried next flush
+        with _lock:
+            _merge_into(_pending, taken)
+
+def _merge_into(data, rows):
+    for page, sections in rows["sections"].items():
+        for name, row in sections.items():
+            _merge_section(data["sections"].setdefault(page, {}).setdefault(name, {}), row)
+    for page, row in rows["pages"].items():
+        _merge_page(data["pages"].setdefault(page, {}), row)
+
+@contextmanager
+def _file_lock():
+    # Other host processes merge into the same file: hold an exclusive lock
+    # across read -> merge -> replace so no one's update is lost
+    try:
+        import fcntl
+    except ImportError:
+        yield  # Windows: single-process hosts only
+        return
+    with open(METRICS_PATH + ".lock", "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def _write_atomic(data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(METRICS_PATH), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp, METRICS_PATH)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def reset():
+    with _lock:
+        _pending["sections"], _pending["pages"] = {}, {}
+        try:
+            with _file_lock():
+                os.remove(METRICS_PATH)
+        except OSError:
+            pass
+
+def slowest_sections(data, limit=None):
+    # Flat rows sorted by total time spent (calls x mean), the real cost of a rerun-heavy app
+    rows = []
+    for page, sections in data["sections"].items():
+        for name, row in sections.items():
+            rows.append({
+                "Page": page,
+                "Section": name,
+                "Calls": row["calls"],
+                "Mean (ms)": round(row["total_ms"] / max(row["calls"], 1), 1),
+                "Max (ms)": row["max_ms"],
+                "Total (s)": round(row["total_ms"] / 1000, 2),
+                "RSS growth (MB)": row["max_growth_mb"],
+                "Raised peak by (MB)": row.get("raised_peak_mb", 0.0),
+                "Process peak RSS (MB)": row["peak_rss_mb"],
+            })
+    rows.sort(key=lambda r: -r["Total (s)"])
+    return rows[:limit] if limit else rows
+
+if ENABLED:
+    atexit.register(flush, True)
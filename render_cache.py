@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+# --- RENDER CACHE ---
+# Finished renders keyed on the uploaded bytes + scene parameters.
+# Two tiers: a size-bounded LRU in memory (shared by every session in the
+# process) and a size-bounded directory on disk (survives restarts).
+# Values are the encoded bytes, so a hit skips both the render and the encode.
+
+CACHE_DIR = ".render_cache"
+MAX_MEMORY_BYTES = 64 * 1024 * 1024   # ~20 full-size 1920px PNG mockups
+MAX_DISK_BYTES = 512 * 1024 * 1024
+
+def cache_key(data, params):
+    # Same cover + same scene = same render. Params are hashed in a stable
+    # order so {"a": 1, "b": 2} and {"b": 2, "a": 1} share an entry.
+    h = hashlib.sha256(data)
+    h.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
+
+class RenderCache:
+    def __init__(self, cache_dir=CACHE_DIR, max_memory_bytes=MAX_MEMORY_BYTES, max_disk_bytes=MAX_DISK_BYTES, ext="png"):
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.ext = ext
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()  # Streamlit runs each session on its own thread
+        self.hits = {"memory": 0, "disk": 0, "miss": 0}
+        if cache_dir:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError:
+                self.cache_dir = None  # memory tier only
+
+    # --- PUBLIC ---
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits["memory"] += 1
+                return self._memory[key]
+
+        data = self._disk_get(key)
+        if data is None:
+            self.hits["miss"] += 1
+            return None
+        self.hits["disk"] += 1
+        self._memory_put(key, data)  # promote so the next rerun doesn't touch the disk
+        return data
+
+    def put(self, key, data):
+        self._memory_put(key, data)
+        self._disk_put(key, data)
+
+    # --- MEMORY TIER ---
+    def _memory_put(self, key, data):
+        if len(data) > self.max_memory_bytes:
+            return  # would evict everything else for one entry; disk tier still has it
+        with self._lock:
+            if key in self._memory:
+                self._memory_bytes -= len(self._memory.pop(key))
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, old = self._memory.popitem(last=False)
+                self._memory_bytes -= len(old)
+
+    # --- DISK TIER ---
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.{self.ext}")
+
+    def _disk_get(self, key):
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # mtime doubles as "last used" for pruning
+            return data
+        except OSError:
+            return None
+
+    def _disk_put(self, key, data):
+        if not self.cache_dir:
+            return
+        try:
+            # Write-then-rename so a concurrent reader never sees half a PNG
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return  # read-only: the memory tier still works
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            # Full disk: don't leave the partial file behind, pruning only
+            # looks at finished renders
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        try:
+            self._disk_prune()
+        except OSError:
+            pass
+
+    def _disk_prune(self):
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(f".{self.ext}"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+            entries.append((info.st_mtime, info.st_size, path))
+            total += info.st_size
+        entries.sort()  # least recently used first
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
@@ -1,38 +1,26 @@
 import streamlit as st
-import google.generativeai as genai
-from fpdf import FPDF
-import base64
+
+import lesson_packs
+import profiling
+import shared
+import theme
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(page_title="The Pocket School", page_icon="🌍", layout="centered")
 
 # --- CUSTOM STYLING ---
-st.markdown("""
-<style>
-    .stApp { background-color: #fcfcfc; color: #111; }
-    h1 { color: #2e7d32; font-family: 'Arial', sans-serif; letter-spacing: -1px; }
-    .lesson-box { 
-        background-color: #f1f8e9; 
-        padding: 25px; 
-        border-radius: 12px; 
-        border-left: 6px solid #2e7d32;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        margin-top: 20px;
-    }
-    .stButton button { width: 100%; background-color: #2e7d32; color: white; font-weight: bold; padding: 12px; }
-    .stButton button:hover { background-color: #1b5e20; }
-</style>
-""", unsafe_allow_html=True)
+theme.apply("school")
 
 # --- CREDENTIALS ---
-if "GEMINI_API_KEY" in st.secrets:
-    genai.configure(api_key=st.secrets["GEMINI_API_KEY"])
-else:
+# Only checked here; the Gemini SDK itself is loaded when a class starts
+if "GEMINI_API_KEY" not in st.secrets:
     st.error("🔑 Critical Error: GEMINI_API_KEY missing from secrets.")
     st.stop()
 
 # --- PDF GENERATOR FUNCTION ---
 def create_pdf(lesson_text, subject, age, location):
+    from fpdf import FPDF
+
     pdf = FPDF()
     pdf.add_page()
     pdf.set_auto_page_break(auto=True, margin=15)
@@ -94,7 +82,9 @@ def generate_lesson_google(age, subj, loc, topic):
     full_prompt = f"{system_instruction}\n\nTASK: {user_request}"
     
     # Using the Lite model that works for you
-    model = genai.GenerativeModel('gemini-flash-latest')
+    # Shared process-wide; google.generativeai pulls in grpc + protobuf (~1s),
+    # paid on the first "Start Class", not on every page load
+    model = shared.gemini_model('gemini-flash-latest')
     
     response = model.generate_content(full_prompt)
     return response.text
@@ -102,13 +92,18 @@ def generate_lesson_google(age, subj, loc, topic):
 # --- MAIN ACTION ---
 if "lesson_content" not in st.session_state:
     st.session_state.lesson_content = ""
+if "pack_lessons" not in st.session_state:
+    st.session_state.pack_lessons = {}   # (age, subject, region, topic) -> lesson text
 
 if st.button("🎓 Start Class"):
     try:
         with st.spinner("Teacher is preparing..."):
             # Generate and store in session state so it doesn't disappear when we click download
-            st.session_state.lesson_content = generate_lesson_google(student_age, subject, region, topic_drill)
+            with profiling.section("lesson generation"):
+                st.session_state.lesson_content = generate_lesson_google(student_age, subject, region, topic_drill)
             st.session_state.generated = True
+            # Remember it for the offline pack so it's never generated twice
+            st.session_state.pack_lessons[(student_age, subject, region, topic_drill.strip())] = st.session_state.lesson_content
             
     except Exception as e:
         st.error(f"Error: {e}")
@@ -119,11 +114,84 @@ if st.session_state.lesson_content:
     st.markdown(f"<div class='lesson-box'>{st.session_state.lesson_content}</div>", unsafe_allow_html=True)
     
     # --- DOWNLOAD BUTTON ---
-    pdf_bytes = create_pdf(st.session_state.lesson_content, subject, student_age, region)
+    # Rebuilt on every rerun while a lesson is on screen
+    with profiling.section("pdf build"):
+        pdf_bytes = create_pdf(st.session_state.lesson_content, subject, student_age, region)
     
     st.download_button(
         label="📥 Download Lesson Plan (PDF)",
         data=pdf_bytes,
         file_name="pocket_school_lesson.pdf",
         mime="application/pdf"
-    )
\ No newline at end of file
+    )
+
+# --- OFFLINE LESSON PACK ---
+# A whole term in one small .zip: an offline HTML viewer + the lessons as JSON
+# (+ optional PDFs). Download once on wifi, teach all term without data.
+st.divider()
+with st.expander("📦 Offline Lesson Pack (low-data classrooms)"):
+    st.caption(f"Builds every topic below for **{subject}**, **{student_age}** in **{region}**. "
+               "Lessons you've already generated are reused, not paid for twice.")
+    topics_input = st.text_area(f"Term topics (one per line, up to {lesson_packs.MAX_LESSONS}):", placeholder="Fractions\nDecimals\nPercentages", height=150)
+    include_pdfs = st.checkbox("Include printable PDFs (bigger download)")
+
+    if st.button("📦 Build Pack"):
+        topics = list(dict.fromkeys(t.strip() for t in topics_input.splitlines() if t.strip()))
+        if not topics and topic_drill.strip():
+            topics = [topic_drill.strip()]
+        if not topics:
+            st.warning("Add at least one topic first!")
+            st.stop()
+        if len(topics) > lesson_packs.MAX_LESSONS:
+            dropped = topics[lesson_packs.MAX_LESSONS:]
+            st.warning(f"A pack holds {lesson_packs.MAX_LESSONS} lessons, so these topics were left out: "
+                       f"{', '.join(dropped)}. Build a second pack for them.")
+            topics = topics[:lesson_packs.MAX_LESSONS]
+
+        cache = st.session_state.pack_lessons
+        missing = [t for t in topics if (student_age, subject, region, t) not in cache]
+        progress_bar = st.progress(0)
+        status_text = st.empty()
+        failed = []
+        for i, topic in enumerate(missing):
+            status_text.text(f"Teacher is preparing: {topic}...")
+            try:
+                with profiling.section("pack lesson generation"):
+                    cache[(student_age, subject, region, topic)] = generate_lesson_google(student_age, subject, region, topic)
+            except Exception as e:
+                failed.append(f"{topic} ({e})")
+            progress_bar.progress((i + 1) / len(missing))
+        status_text.empty()
+        progress_bar.empty()
+        if failed:
+            st.warning("Skipped: " + "; ".join(failed))
+
+        lessons = [
+            lesson_packs.lesson_record(cache[(student_age, subject, region, t)], subject, student_age, region, t)
+            for t in topics if (student_age, subject, region, t) in cache
+        ]
+        if lessons:
+            with profiling.section("pack build"):
+                data, sizes = lesson_packs.build_pack(lessons, region, subject, student_age,
+                                                      make_pdf=create_pdf if include_pdfs else None)
+            st.session_state.lesson_pack = {
+                "name": lesson_packs.pack_name(region, subject, student_age),
+                "data": data,
+                "sizes": sizes,
+                "count": len(lessons),
+            }
+
+    pack = st.session_state.get("lesson_pack")
+    if pack:
+        raw = sum(r for r, _ in pack["sizes"].values())
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Download size", lesson_packs.size_label(len(pack["data"])))
+        m2.metric("Per lesson", lesson_packs.size_label(len(pack["data"]) / pack["count"]))
+        m3.metric("Unpacked", lesson_packs.size_label(raw))
+        st.caption("Inside: " + ", ".join(f"{name} {lesson_packs.size_label(c)}" for name, (_, c) in pack["sizes"].items()))
+        st.download_button(
+            label=f"📥 Download {pack['count']} Lessons (.zip)",
+            data=pack["data"],
+            file_name=pack["name"],
+            mime="application/zip"
+        )
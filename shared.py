@@ -0,0 +1,119 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+import profiling
+
+# --- SHARED RESOURCES ---
+# Process-wide singletons. Run standalone, each app still works exactly as
+# before; mounted together under streamlit_app.py they share one copy of each
+# client, pool and cache instead of six.
+#
+# Heavy SDKs are imported inside the functions, so a page only pays for the
+# ones it actually uses.
+
+# httpx drops idle sockets after 5s by default, too soon for a connection
+# pre-warmed while the user is still typing (see prefetch.py)
+OPENROUTER_KEEPALIVE = 90
+
+def _new_openrouter_client(api_key, max_connections):
+    import httpx
+    from openai import DefaultHttpxClient, OpenAI
+    http_client = DefaultHttpxClient(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                            keepalive_expiry=OPENROUTER_KEEPALIVE)
+    )
+    return OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_key, http_client=http_client)
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _deploy_openrouter_client(api_key):
+    # The deploy's own key: one client (and one HTTPS pool) for the whole process
+    return _new_openrouter_client(api_key, max_connections=20)
+
+def _secret(name):
+    try:
+        return st.secrets.get(name)
+    except Exception:
+        return None  # no secrets.toml at all
+
+def openrouter_client(api_key):
+    if api_key == _secret("OPENROUTER_API_KEY"):
+        return _deploy_openrouter_client(api_key)
+    # A key a visitor typed in stays in their session: it isn't kept in a
+    # process-wide cache, and its client goes away with the session
+    held = st.session_state.get("_openrouter_client")
+    if held and held[0] == api_key:
+        return held[1]
+    if held:
+        held[1].close()
+    client = _new_openrouter_client(api_key, max_connections=4)
+    st.session_state["_openrouter_client"] = (api_key, client)
+    return client
+
+@st.cache_resource(show_spinner=False)
+def gemini_model(model_name):
+    import google.generativeai as genai
+    genai.configure(api_key=st.secrets["GEMINI_API_KEY"])
+    return genai.GenerativeModel(model_name)
+
+@st.cache_resource(show_spinner=False)
+def http_session():
+    # Keep-alive pool shared by the auditor's checks (and anything else that
+    # needs plain HTTP), instead of a new TCP + TLS handshake per request
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+@st.cache_resource(show_spinner=False)
+def render_cache():
+    from render_cache import RenderCache
+    return RenderCache()
+
+# --- MEMORY PER PAGE ---
+# Filled in by streamlit_app.py around each page run. RSS is process-wide, so
+# "first load" (the growth the first time a page ran, mostly its imports) is
+# the number that says what a page costs to host.
+_page_memory = {}
+_page_memory_lock = threading.Lock()
+
+def current_rss_mb():
+    # Same source as the Profile page, so the two admin pages agree
+    return profiling.rss_mb()
+
+@contextmanager
+def track_page(name):
+    # with track_page("hub"): page.run()
+    modules_before = set(sys.modules)
+    rss_before = current_rss_mb()
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        # Runs on st.stop() / st.rerun() too (they unwind as exceptions)
+        elapsed = time.perf_counter() - t0
+        growth = max(current_rss_mb() - rss_before, 0.0)
+        with _page_memory_lock:
+            row = _page_memory.get(name)
+            if row is None:
+                new_modules = sorted({m.split(".")[0] for m in set(sys.modules) - modules_before if not m.startswith("_")})
+                row = _page_memory[name] = {
+                    "runs": 0,
+                    "first_load_mb": round(growth, 1),
+                    "max_run_mb": 0.0,
+                    "last_run_ms": 0.0,
+                    "modules": new_modules,
+                }
+            row["runs"] += 1
+            row["max_run_mb"] = round(max(row["max_run_mb"], growth), 1)
+            row["last_run_ms"] = round(elapsed * 1000, 1)
+
+def page_memory():
+    with _page_memory_lock:
+        return {name: dict(row) for name, row in _page_memory.items()}
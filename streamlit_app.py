@@ -0,0 +1,99 @@
+import os
+
+import streamlit as st
+
+import profiling
+import shared
+
+# --- ONE HOST, SIX PAGES ---
+# Runs every app in a single Streamlit process:
+#     streamlit run streamlit_app.py
+# One interpreter, one copy of each library, and the clients / caches in
+# shared.py are shared by every page and every visitor.
+# Each app file still runs on its own with `streamlit run <app>.py`.
+#
+# The Admin pages (link monitor, memory, profile) are only mounted when the
+# host is started with RL_ADMIN=1, so a public deploy doesn't expose them.
+ADMIN = os.environ.get("RL_ADMIN", "").lower() in ("1", "true", "yes")
+
+def memory_report():
+    st.set_page_config(page_title="Host Memory", page_icon="🧠", layout="wide")
+    st.title("🧠 Memory per Page")
+    st.caption("One process hosts every page. 'First load' is how much the process grew the first time a page "
+               "ran (mostly the libraries it imports); later runs usually reuse that memory.")
+
+    rows = shared.page_memory()
+    st.metric("Process RSS", f"{shared.current_rss_mb():.0f} MB")
+    if not rows:
+        st.info("No pages have run yet in this process.")
+        return
+
+    st.dataframe(
+        [
+            {
+                "Page": name,
+                "Runs": row["runs"],
+                "First load (MB)": row["first_load_mb"],
+                "Max growth per run (MB)": row["max_run_mb"],
+                "Last run (ms)": row["last_run_ms"],
+                "Imported on first load": ", ".join(row["modules"]),
+            }
+            for name, row in sorted(rows.items(), key=lambda kv: -kv[1]["first_load_mb"])
+        ],
+        use_container_width=True,
+    )
+
+def profile_report():
+    st.set_page_config(page_title="Host Profile", page_icon="⏱️", layout="wide")
+    st.title("⏱️ Slowest Sections")
+    if not profiling.ENABLED:
+        st.info("Profiling is off. Start the host with `RL_PROFILE=1 streamlit run streamlit_app.py` "
+                "to time each page's hot spots.")
+        return
+    st.caption(f"Every rerun of every session, from `{profiling.METRICS_PATH}`. "
+               "'Total' is calls x mean: what a section really costs once reruns add up.")
+
+    profiling.flush(force=True)
+    data = profiling.load_metrics()
+    if st.button("🗑️ Reset metrics"):
+        profiling.reset()
+        st.rerun()
+    if not data["sections"]:
+        st.info("Nothing recorded yet. Use a few pages and come back.")
+        return
+
+    st.dataframe(profiling.slowest_sections(data), use_container_width=True)
+
+    st.subheader("Reruns per session")
+    st.dataframe(
+        [
+            {
+                "Page": name,
+                "Sessions": row["sessions"],
+                "Reruns": row["reruns"],
+                "Reruns / session": round(row["reruns"] / max(row["sessions"], 1), 1),
+                "Most in one session": row["max_reruns_per_session"],
+            }
+            for name, row in sorted(data["pages"].items(), key=lambda kv: -kv[1]["reruns"])
+        ],
+        use_container_width=True,
+    )
+
+PAGES = {
+    "Hub": st.Page("hub.py", title="Official Hub", icon="👑", url_path="hub", default=True),
+    "Studio": st.Page("app.py", title="Mobile Studio", icon="🧭", url_path="studio"),
+    "Funnel": st.Page("funnel.py", title="Pocket Publisher", icon="🚀", url_path="funnel"),
+    "Mockup": st.Page("mockup.py", title="Library Studio", icon="🕯️", url_path="mockup"),
+    "School": st.Page("school.py", title="Pocket School", icon="🌍", url_path="school"),
+    "Monitor": st.Page("auditor.py", title="Empire Monitor", icon="🟢", url_path="monitor"),
+    "Memory": st.Page(memory_report, title="Memory", icon="🧠", url_path="memory"),
+    "Profile": st.Page(profile_report, title="Profile", icon="⏱️", url_path="profile"),
+}
+
+sections = {"Apps": [PAGES[k] for k in ("Hub", "Studio", "Funnel", "Mockup", "School")]}
+if ADMIN:
+    sections["Admin"] = [PAGES["Monitor"], PAGES["Memory"], PAGES["Profile"]]
+page = st.navigation(sections)
+
+with shared.track_page(page.title), profiling.run(page.title):
+    page.run()
@@ -0,0 +1,219 @@
+import re
+
+# --- SHARED THEME ---
+# Every app's stylesheet in one place. Each one is minified once, when this
+# module is first imported (Python keeps it in sys.modules across Streamlit
+# reruns), so a rerun just sends a ready-made string instead of re-reading
+# and re-sending a big indented <style> block.
+#
+#   import theme
+#   theme.apply("hub")          # inside a Streamlit script
+#   theme.css("funnel")         # raw CSS, e.g. for build_funnel.py
+
+# --- RHYTHM LOGIC STUDIO (app.py) ---
+STUDIO = """
+    .stApp { background-color: #0e1117; color: white; }
+    .stButton button { width: 100%; border-radius: 12px; font-weight: bold; background-color: #d4af37; color: black; border: none; padding: 15px 0px; }
+    .stButton button:hover { background-color: #f4cf57; color: black; }
+    h1, h2 { color: #d4af37; text-align: center; font-family: 'Helvetica', sans-serif; text-transform: uppercase; letter-spacing: 2px; }
+    .step-text { text-align: center; font-size: 18px; margin-bottom: 20px; color: #ccc; }
+    .stDeployButton {display:none;}
+    .director-box { border: 1px solid #444; padding: 20px; border-radius: 15px; background-color: #1e1e1e; margin-top: 20px;}
+
+    /* Gumroad Paywall Styles */
+    .paywall-box { border: 2px solid #ff90e8; padding: 30px; border-radius: 20px; text-align: center; background-color: #1a1a1a; margin-top: 50px; }
+    .price-tag { font-size: 40px; color: #d4af37; font-weight: bold; }
+    .per-month { font-size: 16px; color: #aaa; }
+"""
+
+# --- EMPIRE MONITOR (auditor.py) ---
+MONITOR = """
+    .stApp { background-color: #0e1117; color: white; }
+    h1 { color: #d4af37; font-family: 'Helvetica', sans-serif; text-transform: uppercase; }
+    .status-live { color: #00ff00; font-weight: bold; background-color: #003300; padding: 5px; border-radius: 5px;}
+    .status-broken { color: #ff4b4b; font-weight: bold; background-color: #330000; padding: 5px; border-radius: 5px;}
+    .stTextArea textarea { background-color: #1e1e1e; color: #fff; }
+"""
+
+# --- THE "CLICKFUNNELS" LOOK (funnel.py) ---
+FUNNEL = """
+    /* REMOVE STREAMLIT BRANDING */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+
+    /* GLOBAL STYLES */
+    .stApp { background-color: #000000; color: white; font-family: 'Helvetica Neue', sans-serif; }
+
+    /* HERO SECTION */
+    .hero-container { text-align: center; padding: 40px 20px; }
+    .main-headline {
+        font-size: 60px;
+        font-weight: 800;
+        background: -webkit-linear-gradient(#d4af37, #fcf6ba);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        margin-bottom: 10px;
+    }
+    .sub-headline { font-size: 24px; color: #ccc; margin-bottom: 30px; }
+
+    /* VIDEO PLACEHOLDER */
+    .video-box {
+        border: 2px solid #333;
+        border-radius: 20px;
+        padding: 10px;
+        background-color: #111;
+        box-shadow: 0 0 20px rgba(212, 175, 55, 0.2);
+    }
+
+    /* CTA BUTTON */
+    .cta-button {
+        background-color: #d4af37;
+        color: black;
+        padding: 20px 40px;
+        font-size: 24px;
+        font-weight: bold;
+        border-radius: 50px;
+        text-decoration: none;
+        display: inline-block;
+        margin-top: 20px;
+        margin-bottom: 20px;
+        box-shadow: 0 4px 15px rgba(212, 175, 55, 0.4);
+        transition: transform 0.2s;
+    }
+    .cta-button:hover { transform: scale(1.05); background-color: #fff; color: black;}
+
+    /* FEATURE BOXES */
+    .feature-card {
+        background-color: #1a1a1a;
+        padding: 30px;
+        border-radius: 15px;
+        border: 1px solid #333;
+        text-align: left;
+        height: 100%;
+    }
+    .feature-icon { font-size: 40px; margin-bottom: 10px; }
+    .feature-title { font-size: 20px; font-weight: bold; color: #d4af37; }
+
+    /* THE STACK */
+    .stack-container {
+        border: 2px dashed #444;
+        background-color: #0e0e0e;
+        padding: 40px;
+        border-radius: 20px;
+        margin-top: 50px;
+    }
+    .stack-item { font-size: 18px; margin-bottom: 10px; border-bottom: 1px solid #222; padding-bottom: 10px;}
+    .stack-value { float: right; color: #d4af37; font-weight: bold; }
+    .total-price { font-size: 32px; font-weight: bold; color: white; text-align: center; margin-top: 20px;}
+    .real-price { font-size: 48px; font-weight: 900; color: #d4af37; text-align: center; }
+"""
+
+# --- THE "EMPIRE" THEME (hub.py) ---
+HUB = """
+    /* GLOBAL THEME */
+    .stApp { background-color: #050505; color: white; }
+    h1, h2, h3 { font-family: 'Helvetica Neue', sans-serif; text-transform: uppercase; letter-spacing: 1px; }
+    h1 { color: #d4af37; font-weight: 900; }
+    h2 { color: white; border-bottom: 2px solid #333; padding-bottom: 10px; }
+    a { text-decoration: none; }
+
+    /* CARDS */
+    .app-card {
+        background-color: #1a1a1a;
+        border: 1px solid #333;
+        border-radius: 12px;
+        padding: 20px;
+        height: 240px;
+        transition: all 0.3s ease;
+        display: flex;
+        flex-direction: column;
+        justify-content: space-between;
+    }
+    .app-card:hover {
+        transform: translateY(-5px);
+        border-color: #d4af37;
+        box-shadow: 0 10px 20px rgba(212, 175, 55, 0.1);
+    }
+    .card-title { font-size: 18px; font-weight: bold; color: #fff; margin-bottom: 5px; }
+    .card-desc { font-size: 13px; color: #aaa; margin-bottom: 15px; line-height: 1.4; }
+
+    /* BADGES */
+    .badge-ent { background-color: #444; color: #d4af37; padding: 2px 8px; border-radius: 4px; font-size: 10px; font-weight: bold; border: 1px solid #d4af37; }
+    .badge-app { background-color: #222; color: #ccc; padding: 2px 8px; border-radius: 4px; font-size: 10px; font-weight: bold; }
+
+    /* BUTTONS */
+    .action-btn {
+        background-color: #d4af37;
+        color: black;
+        text-align: center;
+        padding: 10px;
+        border-radius: 6px;
+        font-weight: bold;
+        display: block;
+        transition: background 0.2s;
+    }
+    .action-btn:hover { background-color: #fff; }
+
+    /* HERO SECTION */
+    .hero {
+        text-align: center;
+        padding: 40px 20px;
+        background: radial-gradient(circle at center, #222 0%, #000 100%);
+        border-radius: 20px;
+        margin-bottom: 40px;
+        border: 1px solid #333;
+    }
+"""
+
+# --- THE LIBRARY STUDIO (mockup.py) ---
+MOCKUP = """
+    .stApp { background-color: #050505; color: #d4af37; }
+    h1 { font-family: 'Helvetica', sans-serif; letter-spacing: 2px; text-transform: uppercase; }
+    .stButton button { width: 100%; border-radius: 5px; font-weight: bold; background-color: #d4af37; color: black; border: none; padding: 15px 0px; }
+    .stButton button:hover { background-color: #f4cf57; color: black; }
+"""
+
+# --- THE POCKET SCHOOL (school.py) ---
+SCHOOL = """
+    .stApp { background-color: #fcfcfc; color: #111; }
+    h1 { color: #2e7d32; font-family: 'Arial', sans-serif; letter-spacing: -1px; }
+    .lesson-box {
+        background-color: #f1f8e9;
+        padding: 25px;
+        border-radius: 12px;
+        border-left: 6px solid #2e7d32;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        margin-top: 20px;
+    }
+    .stButton button { width: 100%; background-color: #2e7d32; color: white; font-weight: bold; padding: 12px; }
+    .stButton button:hover { background-color: #1b5e20; }
+"""
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+_SOURCES = {
+    "studio": STUDIO,
+    "monitor": MONITOR,
+    "funnel": FUNNEL,
+    "hub": HUB,
+    "mockup": MOCKUP,
+    "school": SCHOOL,
+}
+
+# Precomputed once per process
+_CSS = {name: minify_css(src) for name, src in _SOURCES.items()}
+_STYLE_TAGS = {name: f"<style>{css}</style>" for name, css in _CSS.items()}
+
+def css(name):
+    return _CSS[name]
+
+def apply(name):
+    # Streamlit is imported here, not at the top, so build scripts can use
+    # css() without pulling in the whole Streamlit runtime
+    import streamlit as st
+    st.markdown(_STYLE_TAGS[name], unsafe_allow_html=True)